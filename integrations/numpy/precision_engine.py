@@ -40,13 +40,18 @@ class ToleranceProfile:
     significant_figures: int
     description: str
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    def __post_init__(self):
+        # Profiles are shared constants; build the payload once
+        self._cached_dict = {
             'absolute': self.absolute,
             'relative': self.relative,
             'significant_figures': self.significant_figures,
             'description': self.description
         }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy of the pre-built payload (callers may mutate it)"""
+        return dict(self._cached_dict)
 
 
 TOLERANCE_PROFILES = {
@@ -77,7 +82,7 @@ TOLERANCE_PROFILES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Result of precision-aware comparison."""
     equivalent: bool
@@ -132,9 +137,10 @@ class PrecisionEngine:
         base = max(abs(value1), abs(value2), 1e-10)
         rel_diff = diff / base
         
-        within_abs = diff <= tol.absolute
-        within_rel = rel_diff <= tol.relative
-        within_tolerance = within_abs or within_rel
+        # Scalar path stays in pure Python: within absolute OR relative tolerance
+        within_tolerance = math.isclose(
+            value1, value2, rel_tol=tol.relative, abs_tol=tol.absolute
+        )
         
         # Exact context requires both
         if ctx == PrecisionContext.EXACT:
@@ -154,7 +160,7 @@ class PrecisionEngine:
         return ComparisonResult(
             equivalent=equivalent,
             difference=float(diff),
-            relative_difference=float(rel_diff),
+            relative_difference=rel_diff,
             within_tolerance=within_tolerance,
             tolerance_used=tol,
             confidence=confidence,
@@ -182,13 +188,14 @@ class PrecisionEngine:
             }
         
         close = np.isclose(a1, a2, rtol=tol.relative, atol=tol.absolute)
+        abs_diff = np.abs(a1 - a2)
         
         return {
-            'equivalent': bool(np.all(close)),
-            'match_fraction': float(np.mean(close)),
-            'max_difference': float(np.max(np.abs(a1 - a2))),
-            'mean_difference': float(np.mean(np.abs(a1 - a2))),
-            'mismatches': int(np.sum(~close)),
+            'equivalent': bool(close.all()),
+            'match_fraction': float(close.mean()),
+            'max_difference': float(abs_diff.max()),
+            'mean_difference': float(abs_diff.mean()),
+            'mismatches': int((~close).sum()),
             'context': ctx.value
         }
     
@@ -204,25 +211,25 @@ class PrecisionEngine:
             return {'rigor': 0.0, 'confidence': 0.0}
         
         # Check for NaN/Inf (low rigor)
-        nan_fraction = np.mean(np.isnan(arr))
-        inf_fraction = np.mean(np.isinf(arr))
+        nan_fraction = np.isnan(arr).mean()
+        inf_fraction = np.isinf(arr).mean()
         clean_fraction = 1.0 - nan_fraction - inf_fraction
         
         # Check precision consistency
         clean_data = arr[np.isfinite(arr)]
         if len(clean_data) > 1:
             # Coefficient of variation
-            mean_val = np.mean(clean_data)
+            mean_val = clean_data.mean()
             if abs(mean_val) > 1e-10:
-                cv = np.std(clean_data) / abs(mean_val)
+                cv = clean_data.std() / abs(mean_val)
                 consistency = 1.0 / (1.0 + cv)
             else:
                 consistency = 0.5
             
-            # Check for suspiciously round numbers
-            def is_round(x):
-                return abs(x - round(x)) < 1e-10 or abs(x * 10 - round(x * 10)) < 1e-9
-            round_fraction = np.mean([is_round(x) for x in clean_data])
+            # Check for suspiciously round numbers (at most one decimal).
+            # Integer roundness is subsumed: integers stay integers after x10.
+            x10 = clean_data * 10.0
+            round_fraction = float((np.abs(x10 - np.rint(x10)) < 1e-9).mean())
             # Too many round numbers might indicate fabrication
             roundness_penalty = 0.0 if round_fraction < 0.8 else (round_fraction - 0.8)
         else:
@@ -42,7 +42,7 @@ class MathematicalContext(Enum):
     COMMUNICATION = "communication"  # Language/expression analysis
 
 
-@dataclass
+@dataclass(slots=True)
 class RhoDimensionReading:
     """
     Rose Glass ρ-dimension reading from mathematical analysis.
@@ -111,6 +111,21 @@ WISDOM_CALIBRATIONS = {
     }
 }
 
+# Aspect weights per calibration, ordered as
+# (consistency, precision, stability, convergence)
+_WEIGHT_KEYS = (
+    "consistency_weight", "precision_weight",
+    "stability_weight", "convergence_weight"
+)
+
+if NUMPY_AVAILABLE:
+    _CAL_WEIGHTS = {
+        name: np.array([cal[key] for key in _WEIGHT_KEYS], dtype=np.float64)
+        for name, cal in WISDOM_CALIBRATIONS.items()
+    }
+else:
+    _CAL_WEIGHTS = {}
+
 
 class WisdomLens:
     """
@@ -182,13 +197,8 @@ class WisdomLens:
         convergence = self._assess_convergence(arr)
         
         # Weighted combination through cultural lens
-        cal = self.calibration
-        rho = (
-            cal["consistency_weight"] * consistency +
-            cal["precision_weight"] * precision +
-            cal["stability_weight"] * stability +
-            cal["convergence_weight"] * convergence
-        )
+        scores = np.array([consistency, precision, stability, convergence])
+        rho = float(_CAL_WEIGHTS[self.calibration_name] @ scores)
         
         # Confidence based on sample size and variance
         confidence = self._calculate_confidence(arr)
@@ -220,11 +230,17 @@ class WisdomLens:
             return 0.5  # Neutral for single values
         
         # Coefficient of variation (lower = more consistent)
-        mean = np.mean(arr)
+        # Mean and std from sum / sum-of-squares in one pass over the data
+        flat = arr.ravel()
+        n = flat.size
+        mean = flat.sum() / n
+        var = float(np.dot(flat, flat)) / n - mean * mean
+        std = math.sqrt(max(var, 0.0))  # Guard against rounding below zero
+        
         if abs(mean) < 1e-10:
             mean = 1e-10  # Avoid division by zero
         
-        cv = np.std(arr) / abs(mean)
+        cv = std / abs(mean)
         
         # Transform CV to 0-1 scale (lower CV = higher consistency)
         # CV of 0 = perfect consistency (1.0)
@@ -255,8 +271,8 @@ class WisdomLens:
             return len(s.split('.')[1].rstrip('0'))
         
         decimals = np.array([count_decimals(x) for x in arr.flat])
-        avg_decimals = np.mean(decimals)
-        decimal_variance = np.var(decimals)
+        avg_decimals = decimals.mean()
+        decimal_variance = decimals.var()
         
         # Context-appropriate precision
         ideal_decimals = {
@@ -284,15 +300,15 @@ class WisdomLens:
             return 0.7  # Moderate stability assumed for small samples
         
         # Add small perturbations and check sensitivity
-        perturbation = np.random.normal(0, 0.01 * np.std(arr) + 1e-10, arr.shape)
+        perturbation = np.random.normal(0, 0.01 * arr.std() + 1e-10, arr.shape)
         perturbed = arr + perturbation
         
         # Compare statistics before/after
-        original_mean = np.mean(arr)
-        perturbed_mean = np.mean(perturbed)
+        original_mean = arr.mean()
+        perturbed_mean = perturbed.mean()
         
-        original_std = np.std(arr)
-        perturbed_std = np.std(perturbed)
+        original_std = arr.std()
+        perturbed_std = perturbed.std()
         
         # Relative change in key statistics
         if abs(original_mean) > 1e-10:
@@ -322,12 +338,11 @@ class WisdomLens:
             return 0.5  # Neutral for very small samples
         
         # Check if later values are more stable than earlier
-        mid = len(arr) // 2
-        first_half = arr[:mid] if arr.ndim == 1 else arr.flat[:mid]
-        second_half = arr[mid:] if arr.ndim == 1 else arr.flat[mid:]
-        
-        first_var = np.var(first_half) if len(first_half) > 1 else 0
-        second_var = np.var(second_half) if len(second_half) > 1 else 0
+        # Both halves as rows of one (2, half) view; variances in a single call.
+        # For odd sizes the trailing element is left out so the halves match.
+        flat = arr.ravel()
+        half = flat.size // 2
+        first_var, second_var = flat[:2 * half].reshape(2, half).var(axis=1)
         
         # Convergence: variance decreasing over time
         if first_var > 1e-10:
@@ -350,8 +365,8 @@ class WisdomLens:
         
         # Confidence decreases with extreme values
         if n > 1:
-            z_scores = (arr - np.mean(arr)) / (np.std(arr) + 1e-10)
-            outlier_fraction = np.mean(np.abs(z_scores) > 3)
+            z_scores = (arr - arr.mean()) / (arr.std() + 1e-10)
+            outlier_fraction = (np.abs(z_scores) > 3).mean()
             outlier_penalty = 1.0 - outlier_fraction
         else:
             outlier_penalty = 1.0
@@ -433,7 +448,8 @@ class WisdomLens:
             'full_rank': False,
             'condition_number': float('inf'),
             'structural_coherence': 0.0,
-            'determinant': None
+            'log_determinant': None,
+            'determinant_sign': None
         }
         
         # Check full rank
@@ -450,10 +466,13 @@ class WisdomLens:
         except np.linalg.LinAlgError:
             result['structural_coherence'] = 0.0
         
-        # Determinant (for square matrices)
-        if mat.shape[0] == mat.shape[1]:
+        # Log-determinant (for square matrices) - det() over/underflows for
+        # larger N; skipped when the condition number already flags singularity
+        if mat.shape[0] == mat.shape[1] and result['condition_number'] <= 1e12:
             try:
-                result['determinant'] = float(np.linalg.det(mat))
+                sign, logdet = np.linalg.slogdet(mat)
+                result['log_determinant'] = float(logdet)
+                result['determinant_sign'] = int(sign)
             except np.linalg.LinAlgError:
                 pass
         
@@ -4,9 +4,20 @@ Pattern Perception Engine - Unified Rose Glass Interface
 Combines all four nematocysts into a single coherence perception system.
 """
 
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 import math
+import threading
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
 try:
     from .nematocysts import (
@@ -24,7 +35,14 @@ except ImportError:
     )
 
 
-@dataclass
+# Coherence cut points; state i covers [threshold[i-1], threshold[i])
+_COHERENCE_THRESH = (0.2, 0.4, 0.6, 0.8)
+_COHERENCE_STATES = (
+    "fragmented", "emerging", "developing", "coherent", "highly_integrated"
+)
+
+
+@dataclass(slots=True)
 class CoherenceReading:
     """
     Complete Rose Glass coherence perception.
@@ -63,17 +81,7 @@ class CoherenceReading:
     
     @property
     def coherence_state(self) -> str:
-        c = self.coherence
-        if c < 0.2:
-            return "fragmented"
-        elif c < 0.4:
-            return "emerging"
-        elif c < 0.6:
-            return "developing"
-        elif c < 0.8:
-            return "coherent"
-        else:
-            return "highly_integrated"
+        return _COHERENCE_STATES[bisect_right(_COHERENCE_THRESH, self.coherence)]
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -97,6 +105,68 @@ class CoherenceReading:
         )
 
 
+@dataclass
+class CoherenceReadingBatch:
+    """
+    Column-oriented coherence readings for many texts.
+    
+    Dimension values live in one (4, N) array - one contiguous row per
+    dimension - so batch statistics touch only the floats they need.
+    Full CoherenceReading objects are built on request via to_readings().
+    """
+    dims: 'np.ndarray'          # Rows: psi, rho, q, f
+    raw: 'np.ndarray'           # Unweighted coherence per text
+    weighted: 'np.ndarray'      # Lens-weighted coherence per text
+    lens_name: str
+    lens_weights: Dict[str, float]
+    readings: Tuple[List[Any], List[Any], List[Any], List[Any]]  # psi, rho, q, f
+    
+    @property
+    def psi(self) -> 'np.ndarray':
+        return self.dims[0]
+    
+    @property
+    def rho(self) -> 'np.ndarray':
+        return self.dims[1]
+    
+    @property
+    def q(self) -> 'np.ndarray':
+        return self.dims[2]
+    
+    @property
+    def f(self) -> 'np.ndarray':
+        return self.dims[3]
+    
+    @property
+    def coherence_states(self) -> 'np.ndarray':
+        """Coherence state label per text, in one searchsorted pass"""
+        idx = np.searchsorted(_COHERENCE_THRESH, self.weighted, side="right")
+        return np.asarray(_COHERENCE_STATES)[idx]
+    
+    def __len__(self) -> int:
+        return self.dims.shape[1]
+    
+    def to_readings(self) -> List[CoherenceReading]:
+        """Materialize per-text CoherenceReading objects"""
+        psi_readings, rho_readings, q_readings, f_readings = self.readings
+        return [
+            CoherenceReading(
+                psi=psi,
+                rho=rho,
+                q=q,
+                f=f,
+                raw_coherence=raw,
+                weighted_coherence=weighted,
+                lens_name=self.lens_name,
+                lens_weights=self.lens_weights,
+            )
+            for psi, rho, q, f, raw, weighted in zip(
+                psi_readings, rho_readings, q_readings, f_readings,
+                self.raw.tolist(), self.weighted.tolist()
+            )
+        ]
+
+
 CULTURAL_LENSES = {
     "modern_academic": {
         "description": "Evidence-based structured argumentation",
@@ -124,6 +194,55 @@ CULTURAL_LENSES = {
     },
 }
 
+# Lens weights as (psi, rho, q, f) vectors, built once at import
+_DIMENSIONS = ("psi", "rho", "q", "f")
+
+if NUMPY_AVAILABLE:
+    _LENS_WEIGHT_VEC = {
+        name: np.array([cfg["weights"][k] for k in _DIMENSIONS], dtype=np.float64)
+        for name, cfg in CULTURAL_LENSES.items()
+    }
+    # (n_lenses, 4): every lens weighting in one matmul
+    _ALL_W = np.vstack([_LENS_WEIGHT_VEC[name] for name in CULTURAL_LENSES])
+else:
+    _LENS_WEIGHT_VEC = {
+        name: tuple(cfg["weights"][k] for k in _DIMENSIONS)
+        for name, cfg in CULTURAL_LENSES.items()
+    }
+_ALL_LENS_NAMES = list(CULTURAL_LENSES)
+
+
+# Nematocysts carry no lens state, so every PatternPerception shares one set
+_NEMATOCYSTS: Optional[Tuple[Any, Any, Any, Any]] = None
+_POOL: Optional[ThreadPoolExecutor] = None
+# Guards first-use construction of the two singletons above
+_INIT_LOCK = threading.Lock()
+
+
+def _get_nematocysts() -> Tuple[Any, Any, Any, Any]:
+    """Build the four nematocysts on first use and reuse them afterwards"""
+    global _NEMATOCYSTS
+    if _NEMATOCYSTS is None:
+        with _INIT_LOCK:
+            if _NEMATOCYSTS is None:
+                _NEMATOCYSTS = (
+                    SentimentLens(),
+                    POSAnalyzer(),
+                    WisdomVectorizer(),
+                    BelongingMapper(),
+                )
+    return _NEMATOCYSTS
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Pool for parallel=True perception, created on first use"""
+    global _POOL
+    if _POOL is None:
+        with _INIT_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cerata-perceive")
+    return _POOL
+
 
 class PatternPerception:
     """
@@ -135,45 +254,105 @@ class PatternPerception:
         print(f"Coherence: {result.coherence:.2f}")
     """
     
-    def __init__(self, lens: str = "rose_glass_default"):
+    def __init__(self,
+                 lens: str = "rose_glass_default",
+                 parallel: bool = False,
+                 cache: bool = False):
         if lens not in CULTURAL_LENSES:
             raise ValueError(f"Unknown lens: {lens}. Available: {list(CULTURAL_LENSES.keys())}")
         
         self.lens_name = lens
         self.lens_config = CULTURAL_LENSES[lens]
         self.weights = self.lens_config["weights"]
+        self._w = _LENS_WEIGHT_VEC[lens]
+        self.parallel = parallel  # Overlap the four nematocysts on _get_pool()
+        self.cache = cache        # Reuse readings for repeated texts
         
-        # Initialize nematocysts
-        self.sentiment_lens = SentimentLens()
-        self.pos_analyzer = POSAnalyzer()
-        self.wisdom_vectorizer = WisdomVectorizer()
-        self.belonging_mapper = BelongingMapper()
+        # Shared nematocysts (built once per process)
+        (self.sentiment_lens, self.pos_analyzer,
+         self.wisdom_vectorizer, self.belonging_mapper) = _get_nematocysts()
+        
+        # Per-instance memo, so cached readings honour this instance's
+        # lens and settings
+        self._perceive_cached = lru_cache(maxsize=1024)(self._perceive_uncached)
     
     def perceive(self, text: str) -> CoherenceReading:
         """
         Perceive coherence patterns in text through all four dimensions.
+        
+        With cache=True, repeated texts return the same CoherenceReading
+        object from this instance - treat it as read-only.
         """
-        # Perceive each dimension
+        if self.cache:
+            return self._perceive_cached(text)
+        return self._perceive_uncached(text)
+    
+    def clear_cache(self) -> None:
+        """Drop this instance's cached perceive() results"""
+        self._perceive_cached.cache_clear()
+    
+    def _perceive_uncached(self, text: str) -> CoherenceReading:
+        """Run the nematocysts and combine through this instance's lens"""
+        return self._combine(*self._perceive_dims(text))
+    
+    def _perceive_dims(self, text: str) -> Tuple[PsiDimensionReading,
+                                                 RhoDimensionReading,
+                                                 QDimensionReading,
+                                                 FDimensionReading]:
+        """Run the four nematocysts once (the expensive, lens-free part)"""
+        if self.parallel:
+            # Independent dimensions: only pays off when the nematocysts
+            # release the GIL (the pure-Python ones do not)
+            submit = _get_pool().submit
+            futures = [
+                submit(nematocyst.perceive, text)
+                for nematocyst in (self.pos_analyzer, self.wisdom_vectorizer,
+                                   self.sentiment_lens, self.belonging_mapper)
+            ]
+            psi_reading, rho_reading, q_reading, f_reading = (
+                future.result() for future in futures
+            )
+            return psi_reading, rho_reading, q_reading, f_reading
+        
         q_reading = self.sentiment_lens.perceive(text)
         psi_reading = self.pos_analyzer.perceive(text)
         rho_reading = self.wisdom_vectorizer.perceive(text)
         f_reading = self.belonging_mapper.perceive(text)
         
+        return psi_reading, rho_reading, q_reading, f_reading
+    
+    def _combine(self,
+                 psi_reading: PsiDimensionReading,
+                 rho_reading: RhoDimensionReading,
+                 q_reading: QDimensionReading,
+                 f_reading: FDimensionReading,
+                 lens_name: Optional[str] = None) -> CoherenceReading:
+        """
+        Combine four dimension readings through a lens.
+        
+        Defaults to this instance's lens; never mutates instance state.
+        """
+        if lens_name is None:
+            lens_name, w, weights = self.lens_name, self._w, self.weights
+        else:
+            w = _LENS_WEIGHT_VEC[lens_name]
+            weights = CULTURAL_LENSES[lens_name]["weights"]
+        
+        dims = (
+            psi_reading.optimized_psi,
+            rho_reading.optimized_rho,
+            q_reading.optimized_q,
+            f_reading.optimized_f,
+        )
+        
         # Calculate raw coherence (unweighted average)
-        raw_coherence = (
-            psi_reading.optimized_psi +
-            rho_reading.optimized_rho +
-            q_reading.optimized_q +
-            f_reading.optimized_f
-        ) / 4
+        raw_coherence = sum(dims) / 4
         
         # Calculate weighted coherence
-        weighted_coherence = (
-            self.weights["psi"] * psi_reading.optimized_psi +
-            self.weights["rho"] * rho_reading.optimized_rho +
-            self.weights["q"] * q_reading.optimized_q +
-            self.weights["f"] * f_reading.optimized_f
-        )
+        if NUMPY_AVAILABLE:
+            weighted_coherence = float(w @ np.array(dims))
+        else:
+            weighted_coherence = sum(wi * d for wi, d in zip(w, dims))
         
         return CoherenceReading(
             psi=psi_reading,
@@ -182,43 +361,120 @@ class PatternPerception:
             f=f_reading,
             raw_coherence=raw_coherence,
             weighted_coherence=weighted_coherence,
-            lens_name=self.lens_name,
-            lens_weights=self.weights,
+            lens_name=lens_name,
+            lens_weights=weights,
         )
     
     def perceive_comparative(
         self, 
         texts: List[str]
     ) -> List[CoherenceReading]:
-        """Perceive multiple texts for comparison"""
-        return [self.perceive(text) for text in texts]
+        """
+        Perceive multiple texts for comparison.
+        
+        Nematocysts exposing perceive_batch process all texts in one pass;
+        the rest fall back to per-text perceive.
+        """
+        if NUMPY_AVAILABLE:
+            return self.perceive_batch(texts).to_readings()
+        
+        return [
+            self._combine(psi, rho, q, f)
+            for psi, rho, q, f in zip(
+                self._run_batch(self.pos_analyzer, texts),
+                self._run_batch(self.wisdom_vectorizer, texts),
+                self._run_batch(self.sentiment_lens, texts),
+                self._run_batch(self.belonging_mapper, texts),
+            )
+        ]
+    
+    def perceive_batch(self, texts: List[str]) -> CoherenceReadingBatch:
+        """
+        Perceive many texts into a column-oriented CoherenceReadingBatch.
+        
+        Weighted coherence for every text is one (4,) @ (4, N) product.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy required for batch perception. Install: pip install numpy")
+        
+        psi_readings = self._run_batch(self.pos_analyzer, texts)
+        rho_readings = self._run_batch(self.wisdom_vectorizer, texts)
+        q_readings = self._run_batch(self.sentiment_lens, texts)
+        f_readings = self._run_batch(self.belonging_mapper, texts)
+        
+        dims = np.empty((4, len(texts)), dtype=np.float64)
+        dims[0] = [r.optimized_psi for r in psi_readings]
+        dims[1] = [r.optimized_rho for r in rho_readings]
+        dims[2] = [r.optimized_q for r in q_readings]
+        dims[3] = [r.optimized_f for r in f_readings]
+        
+        return CoherenceReadingBatch(
+            dims=dims,
+            raw=dims.mean(axis=0),
+            weighted=self._w @ dims,
+            lens_name=self.lens_name,
+            lens_weights=self.weights,
+            readings=(psi_readings, rho_readings, q_readings, f_readings),
+        )
+    
+    @staticmethod
+    def _run_batch(nematocyst: Any, texts: List[str]) -> List[Any]:
+        """Run a nematocyst over texts, batched when it supports it"""
+        batch = getattr(nematocyst, "perceive_batch", None)
+        if batch is not None:
+            return batch(texts)
+        return [nematocyst.perceive(text) for text in texts]
     
     def perceive_through_all_lenses(
         self, 
         text: str
     ) -> Dict[str, CoherenceReading]:
-        """Perceive text through all available lenses"""
-        results = {}
-        original_lens = self.lens_name
-        
-        for lens_name in CULTURAL_LENSES:
-            self.lens_name = lens_name
-            self.lens_config = CULTURAL_LENSES[lens_name]
-            self.weights = self.lens_config["weights"]
-            results[lens_name] = self.perceive(text)
-        
-        # Restore original
-        self.lens_name = original_lens
-        self.lens_config = CULTURAL_LENSES[original_lens]
-        self.weights = self.lens_config["weights"]
+        """
+        Perceive text through all available lenses.
+        
+        The nematocysts run once; only the lens weighting differs.
+        """
+        dims = self._perceive_dims(text)
+        if not NUMPY_AVAILABLE:
+            return {
+                lens_name: self._combine(*dims, lens_name=lens_name)
+                for lens_name in _ALL_LENS_NAMES
+            }
+        
+        psi_reading, rho_reading, q_reading, f_reading = dims
+        dim_arr = np.array([
+            psi_reading.optimized_psi,
+            rho_reading.optimized_rho,
+            q_reading.optimized_q,
+            f_reading.optimized_f,
+        ])
+        raw_coherence = float(dim_arr.mean())
+        weighted_all = (_ALL_W @ dim_arr).tolist()
         
-        return results
+        return {
+            lens_name: CoherenceReading(
+                psi=psi_reading,
+                rho=rho_reading,
+                q=q_reading,
+                f=f_reading,
+                raw_coherence=raw_coherence,
+                weighted_coherence=weighted,
+                lens_name=lens_name,
+                lens_weights=CULTURAL_LENSES[lens_name]["weights"],
+            )
+            for lens_name, weighted in zip(_ALL_LENS_NAMES, weighted_all)
+        }
+
+
+@lru_cache(maxsize=len(CULTURAL_LENSES))
+def _get_perception(lens: str) -> PatternPerception:
+    """Shared PatternPerception per lens, so nematocysts are built once"""
+    return PatternPerception(lens=lens)
 
 
 def quick_perceive(text: str, lens: str = "rose_glass_default") -> CoherenceReading:
     """Quick coherence perception"""
-    perception = PatternPerception(lens=lens)
-    return perception.perceive(text)
+    return _get_perception(lens).perceive(text)
 
 
 if __name__ == "__main__":
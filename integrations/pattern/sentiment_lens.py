@@ -14,8 +14,99 @@ wavelengths into forms synthetic minds can perceive.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from bisect import bisect_right
 import re
 import math
+import sys
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Numba is optional; without it the NumPy (or pure-Python) path is used
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Tokenizer punctuation: anything that is neither word nor whitespace.
+# ASCII text takes the str.translate fast path; other text uses the regex.
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_ASCII_PUNCT_TRANS = str.maketrans({
+    c: ' ' for c in map(chr, range(128)) if _PUNCT_RE.match(c)
+})
+
+
+@njit()
+def _aggregate_kernel(ids, negation_mask, intensifier_mask, sentiment_mask,
+                      modifier_arr, polarity_arr, subjectivity_arr,
+                      intensity_arr):
+    """
+    Compiled token loop over lexicon ids (mirrors _aggregate_loop).
+    
+    Returns (sent_pos, polarity, negated, polarity_sum, subjectivity_sum,
+    weight_sum, negation_count, intensity_modifier_count).
+    """
+    n = ids.shape[0]
+    sent_pos = np.empty(n, dtype=np.int64)
+    polarity_out = np.empty(n, dtype=np.float64)
+    negated_out = np.empty(n, dtype=np.bool_)
+    n_sent = 0
+    
+    polarity_sum = 0.0
+    subjectivity_sum = 0.0
+    weight_sum = 0.0
+    negation_count = 0
+    intensity_modifier_count = 0
+    negation_window = 0
+    current_intensity = 1.0
+    
+    for i in range(n):
+        word = ids[i]
+        if negation_mask[word]:
+            negation_window = 3
+            negation_count += 1
+        elif intensifier_mask[word]:
+            current_intensity = modifier_arr[word]
+            intensity_modifier_count += 1
+        elif sentiment_mask[word]:
+            polarity = polarity_arr[word]
+            if negation_window > 0:
+                polarity = -polarity
+                negation_window -= 1
+            polarity *= current_intensity
+            current_intensity = 1.0
+            
+            subjectivity = subjectivity_arr[word]
+            weight = intensity_arr[word] * subjectivity
+            polarity_sum += polarity * weight
+            subjectivity_sum += subjectivity * weight
+            weight_sum += weight
+            
+            sent_pos[n_sent] = i
+            polarity_out[n_sent] = polarity
+            negated_out[n_sent] = negation_window > 0
+            n_sent += 1
+    
+    return (sent_pos[:n_sent], polarity_out[:n_sent], negated_out[:n_sent],
+            polarity_sum, subjectivity_sum, weight_sum,
+            negation_count, intensity_modifier_count)
+
+
+# Token count above which perceive() uses the Numba kernel; below it the
+# plain loop is faster (about equal near 1000 tokens)
+JIT_MIN_TOKENS = 2000
+
+# optimized_q cut points; state i covers [threshold[i-1], threshold[i])
+_ACTIVATION_THRESH = (0.2, 0.4, 0.6, 0.8)
+_ACTIVATION_STATES = ("dormant", "mild", "moderate", "elevated", "intense")
 
 
 class EmotionalValence(Enum):
@@ -26,7 +117,7 @@ class EmotionalValence(Enum):
     MIXED = "mixed"
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentAssessment:
     """
     Assessment of a single word or phrase.
@@ -46,7 +137,7 @@ class SentimentAssessment:
         return EmotionalValence.POSITIVE if self.polarity > 0 else EmotionalValence.NEGATIVE
 
 
-@dataclass
+@dataclass(slots=True)
 class QDimensionReading:
     """
     Rose Glass q-dimension perception output.
@@ -59,7 +150,10 @@ class QDimensionReading:
     polarity: float                        # Overall emotional direction
     subjectivity: float                    # Objective vs subjective balance
     valence: EmotionalValence              # Categorical valence
-    assessments: List[SentimentAssessment] # Individual word assessments
+    # Per-word (texts, polarities, subjectivities, intensities, negated)
+    # columns; SentimentAssessment objects are only built on access
+    _assessment_raw: Tuple[List[str], List[float], List[float],
+                           List[float], List[bool]] = field(repr=False)
     negation_count: int                    # Number of negations detected
     intensity_modifiers: int               # Number of intensifiers
     
@@ -67,19 +161,33 @@ class QDimensionReading:
     Km: float = 0.3                         # Michaelis constant
     Ki: float = 2.0                         # Inhibition constant
     
+    # Memo for `assessments` (slots rule out cached_property)
+    _assessments: Optional[List[SentimentAssessment]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def assessments(self) -> List[SentimentAssessment]:
+        """Individual word assessments, materialized on first access"""
+        if self._assessments is not None:
+            return self._assessments
+        self._assessments = [
+            SentimentAssessment(
+                text=text,
+                polarity=polarity,
+                subjectivity=subjectivity,
+                intensity=intensity,
+                negated=negated
+            )
+            for text, polarity, subjectivity, intensity, negated
+            in zip(*self._assessment_raw)
+        ]
+        return self._assessments
+    
     @property
     def activation_state(self) -> str:
         """Human-readable activation state"""
-        if self.optimized_q < 0.2:
-            return "dormant"
-        elif self.optimized_q < 0.4:
-            return "mild"
-        elif self.optimized_q < 0.6:
-            return "moderate"
-        elif self.optimized_q < 0.8:
-            return "elevated"
-        else:
-            return "intense"
+        return _ACTIVATION_STATES[bisect_right(_ACTIVATION_THRESH, self.optimized_q)]
 
 
 class SentimentLexicon:
@@ -94,98 +202,162 @@ class SentimentLexicon:
     In production, load from Pattern's XML files.
     """
     
+    # Tables are class-level so every instance shares them without rebuilding.
+    # Core sentiment words (subset for demonstration)
+    # Full lexicon would be loaded from Pattern's en-sentiment.xml
+    _lexicon: Dict[str, Tuple[float, float, float]] = {
+        # Format: word -> (polarity, subjectivity, intensity)
+        
+        # Positive words
+        "good": (0.7, 0.6, 1.0),
+        "great": (0.8, 0.75, 1.0),
+        "excellent": (0.9, 0.8, 1.0),
+        "amazing": (0.85, 0.9, 1.0),
+        "wonderful": (0.85, 0.85, 1.0),
+        "beautiful": (0.8, 0.85, 1.0),
+        "love": (0.8, 0.9, 1.0),
+        "best": (0.9, 0.7, 1.0),
+        "happy": (0.8, 0.9, 1.0),
+        "joy": (0.85, 0.95, 1.0),
+        "brilliant": (0.85, 0.75, 1.0),
+        "fantastic": (0.85, 0.85, 1.0),
+        "perfect": (0.9, 0.75, 1.0),
+        "success": (0.7, 0.5, 1.0),
+        "win": (0.7, 0.6, 1.0),
+        "impressive": (0.7, 0.7, 1.0),
+        "innovative": (0.6, 0.5, 1.0),
+        "effective": (0.6, 0.4, 1.0),
+        "efficient": (0.5, 0.3, 1.0),
+        "clear": (0.4, 0.3, 1.0),
+        "strong": (0.5, 0.4, 1.0),
+        "coherent": (0.5, 0.3, 1.0),  # Rose Glass aligned
+        
+        # Negative words
+        "bad": (-0.7, 0.6, 1.0),
+        "terrible": (-0.9, 0.8, 1.0),
+        "awful": (-0.85, 0.85, 1.0),
+        "horrible": (-0.9, 0.85, 1.0),
+        "hate": (-0.8, 0.9, 1.0),
+        "worst": (-0.9, 0.75, 1.0),
+        "sad": (-0.7, 0.9, 1.0),
+        "angry": (-0.7, 0.9, 1.0),
+        "fear": (-0.6, 0.85, 1.0),
+        "failure": (-0.7, 0.5, 1.0),
+        "fail": (-0.7, 0.6, 1.0),
+        "wrong": (-0.6, 0.5, 1.0),
+        "poor": (-0.5, 0.5, 1.0),
+        "weak": (-0.5, 0.4, 1.0),
+        "confused": (-0.4, 0.6, 1.0),
+        "incoherent": (-0.5, 0.4, 1.0),  # Rose Glass aligned
+        "fragmented": (-0.4, 0.3, 1.0),
+        "broken": (-0.6, 0.5, 1.0),
+        
+        # Neutral/analytical words (low subjectivity)
+        "analysis": (0.1, 0.2, 1.0),
+        "data": (0.0, 0.1, 1.0),
+        "evidence": (0.2, 0.2, 1.0),
+        "research": (0.2, 0.2, 1.0),
+        "study": (0.1, 0.2, 1.0),
+        "conclusion": (0.1, 0.3, 1.0),
+        "framework": (0.2, 0.2, 1.0),
+        "pattern": (0.1, 0.2, 1.0),
+        "translation": (0.2, 0.3, 1.0),  # Rose Glass aligned
+    }
+    
+    # Negation words
+    _negations = frozenset({
+        "not", "no", "never", "neither", "nobody", "nothing",
+        "nowhere", "none", "isn't", "aren't", "wasn't", "weren't",
+        "haven't", "hasn't", "hadn't", "won't", "wouldn't", "don't",
+        "doesn't", "didn't", "can't", "couldn't", "shouldn't",
+        "mightn't", "mustn't", "without", "lack", "lacking"
+    })
+    
+    # Intensity modifiers
+    _intensifiers = {
+        "very": 1.3,
+        "really": 1.25,
+        "extremely": 1.5,
+        "incredibly": 1.4,
+        "absolutely": 1.45,
+        "completely": 1.35,
+        "totally": 1.3,
+        "utterly": 1.4,
+        "highly": 1.25,
+        "deeply": 1.3,
+        "truly": 1.2,
+        "quite": 1.1,
+        "rather": 1.05,
+        "somewhat": 0.8,
+        "slightly": 0.7,
+        "barely": 0.5,
+        "hardly": 0.4,
+        "scarcely": 0.3,
+    }
+    
     def __init__(self):
-        # Core sentiment words (subset for demonstration)
-        # Full lexicon would be loaded from Pattern's en-sentiment.xml
-        self._lexicon: Dict[str, Tuple[float, float, float]] = {
-            # Format: word -> (polarity, subjectivity, intensity)
-            
-            # Positive words
-            "good": (0.7, 0.6, 1.0),
-            "great": (0.8, 0.75, 1.0),
-            "excellent": (0.9, 0.8, 1.0),
-            "amazing": (0.85, 0.9, 1.0),
-            "wonderful": (0.85, 0.85, 1.0),
-            "beautiful": (0.8, 0.85, 1.0),
-            "love": (0.8, 0.9, 1.0),
-            "best": (0.9, 0.7, 1.0),
-            "happy": (0.8, 0.9, 1.0),
-            "joy": (0.85, 0.95, 1.0),
-            "brilliant": (0.85, 0.75, 1.0),
-            "fantastic": (0.85, 0.85, 1.0),
-            "perfect": (0.9, 0.75, 1.0),
-            "success": (0.7, 0.5, 1.0),
-            "win": (0.7, 0.6, 1.0),
-            "impressive": (0.7, 0.7, 1.0),
-            "innovative": (0.6, 0.5, 1.0),
-            "effective": (0.6, 0.4, 1.0),
-            "efficient": (0.5, 0.3, 1.0),
-            "clear": (0.4, 0.3, 1.0),
-            "strong": (0.5, 0.4, 1.0),
-            "coherent": (0.5, 0.3, 1.0),  # Rose Glass aligned
-            
-            # Negative words
-            "bad": (-0.7, 0.6, 1.0),
-            "terrible": (-0.9, 0.8, 1.0),
-            "awful": (-0.85, 0.85, 1.0),
-            "horrible": (-0.9, 0.85, 1.0),
-            "hate": (-0.8, 0.9, 1.0),
-            "worst": (-0.9, 0.75, 1.0),
-            "sad": (-0.7, 0.9, 1.0),
-            "angry": (-0.7, 0.9, 1.0),
-            "fear": (-0.6, 0.85, 1.0),
-            "failure": (-0.7, 0.5, 1.0),
-            "fail": (-0.7, 0.6, 1.0),
-            "wrong": (-0.6, 0.5, 1.0),
-            "poor": (-0.5, 0.5, 1.0),
-            "weak": (-0.5, 0.4, 1.0),
-            "confused": (-0.4, 0.6, 1.0),
-            "incoherent": (-0.5, 0.4, 1.0),  # Rose Glass aligned
-            "fragmented": (-0.4, 0.3, 1.0),
-            "broken": (-0.6, 0.5, 1.0),
-            
-            # Neutral/analytical words (low subjectivity)
-            "analysis": (0.1, 0.2, 1.0),
-            "data": (0.0, 0.1, 1.0),
-            "evidence": (0.2, 0.2, 1.0),
-            "research": (0.2, 0.2, 1.0),
-            "study": (0.1, 0.2, 1.0),
-            "conclusion": (0.1, 0.3, 1.0),
-            "framework": (0.2, 0.2, 1.0),
-            "pattern": (0.1, 0.2, 1.0),
-            "translation": (0.2, 0.3, 1.0),  # Rose Glass aligned
-        }
-        
-        # Negation words
-        self._negations = {
-            "not", "no", "never", "neither", "nobody", "nothing",
-            "nowhere", "none", "isn't", "aren't", "wasn't", "weren't",
-            "haven't", "hasn't", "hadn't", "won't", "wouldn't", "don't",
-            "doesn't", "didn't", "can't", "couldn't", "shouldn't",
-            "mightn't", "mustn't", "without", "lack", "lacking"
-        }
-        
-        # Intensity modifiers
-        self._intensifiers = {
-            "very": 1.3,
-            "really": 1.25,
-            "extremely": 1.5,
-            "incredibly": 1.4,
-            "absolutely": 1.45,
-            "completely": 1.35,
-            "totally": 1.3,
-            "utterly": 1.4,
-            "highly": 1.25,
-            "deeply": 1.3,
-            "truly": 1.2,
-            "quite": 1.1,
-            "rather": 1.05,
-            "somewhat": 0.8,
-            "slightly": 0.7,
-            "barely": 0.5,
-            "hardly": 0.4,
-            "scarcely": 0.3,
-        }
+        # Merged lookup tables are built once per lexicon class
+        if "_merged" not in type(self).__dict__:
+            type(self)._build_tables()
+    
+    @classmethod
+    def _build_tables(cls) -> None:
+        """
+        Merge negations, intensifiers and sentiment words into one
+        word -> entry map, plus parallel NumPy arrays indexed by word id.
+        
+        Entries are ('n',), ('i', modifier) or ('s', polarity, subjectivity,
+        intensity). Precedence matches the original lookup order: negation,
+        then intensifier, then sentiment. The final id is reserved for
+        unknown tokens.
+        """
+        # Keys are interned so matched tokens can share them
+        intern = sys.intern
+        merged: Dict[str, Tuple] = {}
+        for word, values in cls._lexicon.items():
+            merged[intern(word)] = ('s',) + tuple(values)
+        for word, modifier in cls._intensifiers.items():
+            merged[intern(word)] = ('i', modifier)
+        for word in cls._negations:
+            merged[intern(word)] = ('n',)
+        cls._merged = merged
+        
+        if not NUMPY_AVAILABLE:
+            return
+        
+        word_ids: Dict[str, int] = {}
+        rows = []  # (polarity, subjectivity, intensity, modifier, kind)
+        for word, entry in merged.items():
+            word_ids[word] = len(rows)
+            kind = entry[0]
+            if kind == 'n':
+                rows.append((0.0, 0.0, 0.0, 1.0, 1))
+            elif kind == 'i':
+                rows.append((0.0, 0.0, 0.0, entry[1], 2))
+            else:
+                rows.append(entry[1:] + (1.0, 3))
+        rows.append((0.0, 0.0, 0.0, 1.0, 0))
+        
+        table = np.array([row[:4] for row in rows], dtype=np.float64)
+        kinds = np.array([row[4] for row in rows], dtype=np.int8)
+        cls._word_ids = word_ids
+        cls._unknown_id = len(rows) - 1
+        cls._polarity_arr = table[:, 0].copy()
+        cls._subjectivity_arr = table[:, 1].copy()
+        cls._intensity_arr = table[:, 2].copy()
+        cls._modifier_arr = table[:, 3].copy()
+        cls._negation_mask = kinds == 1
+        cls._intensifier_mask = kinds == 2
+        cls._sentiment_mask = kinds == 3
+    
+    def lookup_ids(self, tokens: List[str]) -> 'np.ndarray':
+        """Map lowercased tokens to table ids (unknown tokens -> _unknown_id)"""
+        get = self._word_ids.get
+        unknown = self._unknown_id
+        return np.fromiter(
+            (get(token, unknown) for token in tokens),
+            dtype=np.intp, count=len(tokens)
+        )
     
     def lookup(self, word: str) -> Optional[Tuple[float, float, float]]:
         """Look up word in lexicon"""
@@ -218,8 +390,10 @@ class SentimentLens:
     def _tokenize(self, text: str) -> List[str]:
         """Simple tokenization (Pattern uses more sophisticated approach)"""
         # Remove punctuation, lowercase, split
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-        return text.split()
+        text = text.lower()
+        if text.isascii():
+            return text.translate(_ASCII_PUNCT_TRANS).split()
+        return _PUNCT_RE.sub(' ', text).split()
     
     def _biological_optimization(self, q: float) -> float:
         """
@@ -236,45 +410,71 @@ class SentimentLens:
         denominator = self.Km + q + (q ** 2) / self.Ki
         return q / denominator if denominator > 0 else 0.0
     
-    def perceive(self, text: str) -> QDimensionReading:
+    def _biological_optimization_batch(self, q: 'np.ndarray') -> 'np.ndarray':
+        """Elementwise _biological_optimization: one vectorized divide"""
+        denominator = self.Km + q + q * q / self.Ki
+        return np.divide(q, denominator, out=np.zeros_like(q),
+                         where=(q > 0) & (denominator > 0))
+    
+    def _aggregate_loop(self, tokens: List[str]) -> Tuple:
         """
-        Perceive q-dimension patterns in text.
+        Token-at-a-time aggregation (default path for single texts).
         
-        Returns a QDimensionReading with both raw and optimized values.
+        Returns (assessment_raw, pos_count, neg_count, polarity_sum,
+        subjectivity_sum, weight_sum, negation_count,
+        intensity_modifier_count).
         """
-        tokens = self._tokenize(text)
-        assessments = []
+        texts: List[str] = []
+        polarities: List[float] = []
+        subjectivities: List[float] = []
+        intensities: List[float] = []
+        negations: List[bool] = []
         
         polarity_sum = 0.0
         subjectivity_sum = 0.0
         weight_sum = 0.0
         negation_count = 0
         intensity_modifier_count = 0
+        pos_count = 0
+        neg_count = 0
         
         # Track negation window (Pattern uses ~3 word window)
         negation_active = False
         negation_window = 0
         current_intensity = 1.0
         
-        for i, token in enumerate(tokens):
+        # One merged lookup per token instead of three method calls;
+        # bound methods are hoisted out of the loop
+        merged_get = self.lexicon._merged.get
+        intern = sys.intern
+        add_text = texts.append
+        add_polarity = polarities.append
+        add_subjectivity = subjectivities.append
+        add_intensity = intensities.append
+        add_negated = negations.append
+        
+        for token in tokens:
+            entry = merged_get(token)
+            if entry is None:
+                continue
+            kind = entry[0]
+            
             # Check for negation
-            if self.lexicon.is_negation(token):
+            if kind == 'n':
                 negation_active = True
                 negation_window = 3
                 negation_count += 1
                 continue
             
             # Check for intensity modifier
-            intensity_mod = self.lexicon.get_intensity_modifier(token)
-            if intensity_mod is not None:
-                current_intensity = intensity_mod
+            if kind == 'i':
+                current_intensity = entry[1]
                 intensity_modifier_count += 1
                 continue
             
-            # Look up sentiment
-            sentiment = self.lexicon.lookup(token)
-            if sentiment:
-                polarity, subjectivity, intensity = sentiment
+            # Sentiment word
+            if kind == 's':
+                _, polarity, subjectivity, intensity = entry
                 
                 # Apply negation
                 if negation_active and negation_window > 0:
@@ -287,15 +487,18 @@ class SentimentLens:
                 polarity *= current_intensity
                 current_intensity = 1.0  # Reset after use
                 
-                # Create assessment
-                assessment = SentimentAssessment(
-                    text=token,
-                    polarity=polarity,
-                    subjectivity=subjectivity,
-                    intensity=intensity,
-                    negated=negation_active
-                )
-                assessments.append(assessment)
+                # Tally for mixed-valence detection
+                if polarity > 0.1:
+                    pos_count += 1
+                elif polarity < -0.1:
+                    neg_count += 1
+                
+                # Record assessment columns
+                add_text(intern(token))
+                add_polarity(polarity)
+                add_subjectivity(subjectivity)
+                add_intensity(intensity)
+                add_negated(negation_active)
                 
                 # Accumulate weighted values
                 weight = intensity * subjectivity
@@ -303,6 +506,106 @@ class SentimentLens:
                 subjectivity_sum += subjectivity * weight
                 weight_sum += weight
         
+        return ((texts, polarities, subjectivities, intensities, negations),
+                pos_count, neg_count, polarity_sum, subjectivity_sum,
+                weight_sum, negation_count, intensity_modifier_count)
+    
+    def _score_ids(self,
+                   ids: 'np.ndarray',
+                   seg_start: Optional['np.ndarray'] = None) -> Tuple:
+        """
+        Array-at-a-time scoring of lexicon ids.
+        
+        Same semantics as _aggregate_loop: a negation flips the next three
+        sentiment words, and the most recent intensifier scales the next
+        sentiment word only. seg_start gives, per token, the index where
+        its text begins so windows never cross texts in a batch.
+        
+        Returns (sent_pos, polarity, subjectivity, intensity, negated,
+        weight, is_neg, is_int).
+        """
+        lex = self.lexicon
+        is_neg = lex._negation_mask[ids]
+        is_int = lex._intensifier_mask[ids]
+        is_sent = lex._sentiment_mask[ids]
+        
+        sent_pos = np.flatnonzero(is_sent)
+        idx = np.arange(ids.size)
+        sent_ids = ids[sent_pos]
+        start = 0 if seg_start is None else seg_start[sent_pos]
+        
+        # Sentiment words seen since the latest negation (inclusive)
+        last_neg = np.maximum.accumulate(np.where(is_neg, idx, -1))[sent_pos]
+        has_neg = last_neg >= start
+        sent_rank = np.cumsum(is_sent)
+        since_neg = sent_rank[sent_pos] - sent_rank[last_neg]
+        flipped = has_neg & (since_neg <= 3)
+        negated = has_neg & (since_neg < 3)  # window still open afterwards
+        
+        # Intensifier applies if it follows the previous sentiment word
+        last_int = np.maximum.accumulate(np.where(is_int, idx, -1))[sent_pos]
+        prev_sent = np.concatenate(([-1], sent_pos[:-1]))
+        modifier = np.where(
+            last_int > np.maximum(prev_sent, start - 1),
+            lex._modifier_arr[ids[last_int]],
+            1.0
+        )
+        
+        sign = np.where(flipped, -1.0, 1.0)
+        polarity = lex._polarity_arr[sent_ids] * sign * modifier
+        subjectivity = lex._subjectivity_arr[sent_ids]
+        intensity = lex._intensity_arr[sent_ids]
+        weight = intensity * subjectivity
+        
+        return (sent_pos, polarity, subjectivity, intensity, negated,
+                weight, is_neg, is_int)
+    
+    @staticmethod
+    def _assessment_raw(tokens: List[str],
+                        sent_pos: 'np.ndarray',
+                        polarity: 'np.ndarray',
+                        subjectivity: 'np.ndarray',
+                        intensity: 'np.ndarray',
+                        negated: 'np.ndarray') -> Tuple:
+        """Scored arrays as the column lists QDimensionReading stores"""
+        intern = sys.intern
+        return ([intern(tokens[pos]) for pos in sent_pos.tolist()],
+                polarity.tolist(), subjectivity.tolist(),
+                intensity.tolist(), negated.tolist())
+    
+    def _aggregate_jit(self, tokens: List[str]) -> Tuple:
+        """Numba-compiled counterpart of _aggregate_loop"""
+        lex = self.lexicon
+        ids = lex.lookup_ids(tokens)
+        (sent_pos, polarity, negated, polarity_sum, subjectivity_sum,
+         weight_sum, negation_count, intensity_modifier_count) = _aggregate_kernel(
+            ids, lex._negation_mask, lex._intensifier_mask, lex._sentiment_mask,
+            lex._modifier_arr, lex._polarity_arr, lex._subjectivity_arr,
+            lex._intensity_arr
+        )
+        
+        sent_ids = ids[sent_pos]
+        assessment_raw = self._assessment_raw(
+            tokens, sent_pos, polarity, lex._subjectivity_arr[sent_ids],
+            lex._intensity_arr[sent_ids], negated
+        )
+        
+        return (assessment_raw,
+                int(np.count_nonzero(polarity > 0.1)),
+                int(np.count_nonzero(polarity < -0.1)),
+                polarity_sum, subjectivity_sum, weight_sum,
+                int(negation_count), int(intensity_modifier_count))
+    
+    def _build_reading(self,
+                       assessment_raw: Tuple,
+                       pos_count: int,
+                       neg_count: int,
+                       polarity_sum: float,
+                       subjectivity_sum: float,
+                       weight_sum: float,
+                       negation_count: int,
+                       intensity_modifier_count: int) -> QDimensionReading:
+        """Turn aggregated sums into a QDimensionReading"""
         # Calculate aggregates
         if weight_sum > 0:
             avg_polarity = polarity_sum / weight_sum
@@ -318,6 +621,23 @@ class SentimentLens:
         # Apply biological optimization
         optimized_q = self._biological_optimization(raw_q)
         
+        return self._make_reading(
+            assessment_raw, pos_count, neg_count, avg_polarity,
+            avg_subjectivity, raw_q, optimized_q, negation_count,
+            intensity_modifier_count
+        )
+    
+    def _make_reading(self,
+                      assessment_raw: Tuple,
+                      pos_count: int,
+                      neg_count: int,
+                      avg_polarity: float,
+                      avg_subjectivity: float,
+                      raw_q: float,
+                      optimized_q: float,
+                      negation_count: int,
+                      intensity_modifier_count: int) -> QDimensionReading:
+        """Assign valence and assemble the QDimensionReading"""
         # Determine valence
         if abs(avg_polarity) < 0.1:
             valence = EmotionalValence.NEUTRAL
@@ -327,12 +647,9 @@ class SentimentLens:
             valence = EmotionalValence.NEGATIVE
         
         # Check for mixed signals
-        if assessments:
-            pos_count = sum(1 for a in assessments if a.polarity > 0.1)
-            neg_count = sum(1 for a in assessments if a.polarity < -0.1)
-            if pos_count > 0 and neg_count > 0:
-                if abs(pos_count - neg_count) < max(pos_count, neg_count) * 0.5:
-                    valence = EmotionalValence.MIXED
+        if pos_count > 0 and neg_count > 0:
+            if abs(pos_count - neg_count) < max(pos_count, neg_count) * 0.5:
+                valence = EmotionalValence.MIXED
         
         return QDimensionReading(
             raw_q=raw_q,
@@ -340,13 +657,93 @@ class SentimentLens:
             polarity=avg_polarity,
             subjectivity=avg_subjectivity,
             valence=valence,
-            assessments=assessments,
+            _assessment_raw=assessment_raw,
             negation_count=negation_count,
             intensity_modifiers=intensity_modifier_count,
             Km=self.Km,
             Ki=self.Ki
         )
     
+    def perceive(self, text: str) -> QDimensionReading:
+        """
+        Perceive q-dimension patterns in text.
+        
+        Returns a QDimensionReading with both raw and optimized values.
+        """
+        tokens = self._tokenize(text)
+        
+        # The merged-dict loop wins on typical short texts; the compiled
+        # kernel only pays for its array setup on long documents
+        if NUMBA_AVAILABLE and len(tokens) >= JIT_MIN_TOKENS:
+            aggregate = self._aggregate_jit
+        else:
+            aggregate = self._aggregate_loop
+        
+        return self._build_reading(*aggregate(tokens))
+    
+    def perceive_batch(self, texts: List[str]) -> List[QDimensionReading]:
+        """
+        Perceive q-dimension patterns for many texts in one pass.
+        
+        All tokens are scored as a single concatenated array; per-text
+        sums are then split back out by segment. Falls back to per-text
+        perceive when NumPy is unavailable.
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.perceive(text) for text in texts]
+        if not texts:
+            return []
+        
+        token_lists = [self._tokenize(text) for text in texts]
+        lengths = np.fromiter(map(len, token_lists), dtype=np.intp,
+                              count=len(token_lists))
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        tokens = [token for toks in token_lists for token in toks]
+        
+        n_texts = len(texts)
+        segment = np.repeat(np.arange(n_texts), lengths)
+        ids = self.lexicon.lookup_ids(tokens)
+        (sent_pos, polarity, subjectivity, intensity, negated,
+         weight, is_neg, is_int) = self._score_ids(ids, offsets[segment])
+        
+        # Per-text sums (bincount tolerates texts with no sentiment words)
+        sent_segment = segment[sent_pos]
+        polarity_sums = np.bincount(sent_segment, polarity * weight, n_texts)
+        subjectivity_sums = np.bincount(sent_segment, subjectivity * weight, n_texts)
+        weight_sums = np.bincount(sent_segment, weight, n_texts)
+        negation_counts = np.bincount(segment[is_neg], minlength=n_texts)
+        intensifier_counts = np.bincount(segment[is_int], minlength=n_texts)
+        
+        pos_counts = np.bincount(sent_segment[polarity > 0.1], minlength=n_texts)
+        neg_counts = np.bincount(sent_segment[polarity < -0.1], minlength=n_texts)
+        
+        # Averages and q for the whole batch as single ufunc passes
+        has_weight = weight_sums > 0
+        avg_polarity = np.divide(polarity_sums, weight_sums,
+                                 out=np.zeros(n_texts), where=has_weight)
+        avg_subjectivity = np.divide(subjectivity_sums, weight_sums,
+                                     out=np.zeros(n_texts), where=has_weight)
+        raw_q = np.abs(avg_polarity) * avg_subjectivity
+        optimized_q = self._biological_optimization_batch(raw_q)
+        
+        columns = self._assessment_raw(
+            tokens, sent_pos, polarity, subjectivity, intensity, negated
+        )
+        bounds = np.searchsorted(sent_pos, offsets).tolist()
+        
+        return [
+            self._make_reading(
+                tuple(col[bounds[i]:bounds[i + 1]] for col in columns),
+                *per_text
+            )
+            for i, per_text in enumerate(zip(
+                pos_counts.tolist(), neg_counts.tolist(),
+                avg_polarity.tolist(), avg_subjectivity.tolist(),
+                raw_q.tolist(), optimized_q.tolist(),
+                negation_counts.tolist(), intensifier_counts.tolist()
+            ))
+        ]
+    
     def perceive_comparative(
         self, 
         texts: List[str]
@@ -356,7 +753,7 @@ class SentimentLens:
         
         Useful for comparative analysis or tracking q over time.
         """
-        return [(text, self.perceive(text)) for text in texts]
+        return list(zip(texts, self.perceive_batch(texts)))
 
 
 # Convenience function for direct use
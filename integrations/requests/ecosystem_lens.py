@@ -11,9 +11,13 @@ The f-dimension measures social belonging / ecosystem integration:
 - Health of integration points
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+import asyncio
+import os
+import threading
 import time
 
 try:
@@ -25,6 +29,13 @@ except ImportError:
     REQUESTS_AVAILABLE = False
     requests = None
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
 
 class EndpointHealth(Enum):
     """Health status of an ecosystem connection."""
@@ -34,7 +45,7 @@ class EndpointHealth(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionReading:
     """Rose Glass f-dimension reading for a connection."""
     f_score: float              # Overall f-dimension (0.0-1.0)
@@ -45,14 +56,15 @@ class ConnectionReading:
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            'f_score': self.f_score,
-            'latency_ms': self.latency_ms,
+            # Rounded only when serialized, not on the probe path
+            'f_score': round(self.f_score, 3),
+            'latency_ms': round(self.latency_ms, 2),
             'reliability': self.reliability,
             'health': self.health.value
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationCoherence:
     """Coherence assessment of ecosystem integration."""
     overall_f: float            # Aggregate f-dimension
@@ -73,6 +85,65 @@ class IntegrationCoherence:
         }
 
 
+# Retry policy constants, shared by every session's Retry
+_RETRY_STATUS_FORCELIST = frozenset({429, 500, 502, 503, 504})
+_RETRY_METHODS = frozenset({"HEAD", "GET", "OPTIONS"})
+_RETRY_BACKOFF_MAX = 120.0  # urllib3's Retry.DEFAULT_BACKOFF_MAX
+
+# Statuses from servers that refuse HEAD; re-probe those with a streamed GET
+_HEAD_UNSUPPORTED = (405, 501)
+
+# Enough pooled connections for wide multi-host scans
+_DEFAULT_POOL_SIZE = max(32, 4 * (os.cpu_count() or 1))
+
+
+# Retry policy and pool sizes -> [adapter, number of open lenses using it]
+_ADAPTERS: Dict[Tuple[int, float, int, int], List[Any]] = {}
+_ADAPTERS_LOCK = threading.Lock()
+
+
+def _acquire_adapter(key: Tuple[int, float, int, int]) -> 'HTTPAdapter':
+    """
+    Process-wide HTTPAdapter per retry policy and pool size.
+    
+    The adapter owns the urllib3 pools, so lenses with the same policy
+    reuse TCP/TLS connections and DNS lookups while each keeps its own
+    Session (headers, auth and cookies stay per lens). Timeout is applied
+    per request and is not part of the key.
+    """
+    with _ADAPTERS_LOCK:
+        entry = _ADAPTERS.get(key)
+        if entry is None:
+            retries, backoff_factor, num_pools, pool_maxsize = key
+            # Configure retry strategy (metabolized from requests best practices)
+            retry_strategy = Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=_RETRY_STATUS_FORCELIST,
+                allowed_methods=_RETRY_METHODS
+            )
+            # pool_block=False: overflow opens a throwaway connection, never stalls
+            adapter = HTTPAdapter(
+                pool_connections=num_pools,
+                pool_maxsize=pool_maxsize,
+                max_retries=retry_strategy,
+                pool_block=False
+            )
+            entry = _ADAPTERS[key] = [adapter, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_adapter(key: Tuple[int, float, int, int]) -> None:
+    """Drop one lens's hold on an adapter; the last one closes its pools."""
+    with _ADAPTERS_LOCK:
+        entry = _ADAPTERS[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _ADAPTERS[key]
+            entry[0].close()
+
+
 class EcosystemLens:
     """
     Rose Glass lens for perceiving f-dimension through network connectivity.
@@ -90,7 +161,12 @@ class EcosystemLens:
     def __init__(self, 
                  timeout: float = 10.0,
                  retries: int = 3,
-                 backoff_factor: float = 0.5):
+                 backoff_factor: float = 0.5,
+                 num_pools: int = _DEFAULT_POOL_SIZE,
+                 pool_maxsize: int = _DEFAULT_POOL_SIZE,
+                 cache_ttl: float = 0.0,
+                 cache_maxsize: int = 1024,
+                 max_workers: int = 32):
         """
         Initialize ecosystem lens with resilient connection handling.
         
@@ -98,6 +174,13 @@ class EcosystemLens:
             timeout: Request timeout in seconds
             retries: Number of retry attempts
             backoff_factor: Exponential backoff multiplier
+            num_pools: Number of per-host connection pools to keep
+            pool_maxsize: Connections kept alive per host pool
+            cache_ttl: Seconds a successful reading is reused per URL
+                (0 disables the cache)
+            cache_maxsize: Maximum number of URLs held in the cache
+                (0 also disables it)
+            max_workers: Probe threads used by assess_ecosystem
         """
         if not REQUESTS_AVAILABLE:
             raise ImportError(
@@ -105,18 +188,52 @@ class EcosystemLens:
             )
         
         self.timeout = timeout
-        self.session = requests.Session()
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_workers = max_workers
         
-        # Configure retry strategy (metabolized from requests best practices)
-        retry_strategy = Retry(
-            total=retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Own Session over a shared, refcounted adapter (see close())
+        self._adapter_key = (retries, backoff_factor, num_pools, pool_maxsize)
+        adapter = _acquire_adapter(self._adapter_key)
+        self.session = requests.Session()
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        
+        # url -> (monotonic expiry, reading); insertion-ordered for eviction
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self._reading_cache: Dict[str, Tuple[float, ConnectionReading]] = {}
+        # assess_ecosystem probes from worker threads
+        self._cache_lock = threading.Lock()
+    
+    def _cached_reading(self, url: str) -> Optional[ConnectionReading]:
+        """Fresh cached reading for url, if any."""
+        if self.cache_ttl <= 0 or self.cache_maxsize <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._reading_cache.get(url)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._reading_cache.pop(url, None)
+                return None
+            return entry[1]
+    
+    def _store_reading(self, url: str, reading: ConnectionReading) -> None:
+        """Cache a reading unless caching is off or the probe failed."""
+        if self.cache_ttl <= 0 or self.cache_maxsize <= 0 or reading.reliability == 0.0:
+            return
+        cache = self._reading_cache
+        with self._cache_lock:
+            cache.pop(url, None)
+            while len(cache) >= self.cache_maxsize:
+                cache.pop(next(iter(cache)))
+            cache[url] = (time.monotonic() + self.cache_ttl, reading)
+    
+    def clear_cache(self) -> None:
+        """Forget all cached readings."""
+        with self._cache_lock:
+            self._reading_cache.clear()
     
     def perceive_connection(self, url: str) -> ConnectionReading:
         """
@@ -128,75 +245,243 @@ class EcosystemLens:
         Returns:
             ConnectionReading with ecosystem integration metrics
         """
-        start_time = time.time()
-        notes = []
+        reading = self._cached_reading(url)
+        if reading is None:
+            reading = self._probe(url)
+            self._store_reading(url, reading)
+        return reading
+    
+    def _probe(self, url: str) -> ConnectionReading:
+        """Issue one blocking probe and read it as an f-dimension."""
+        start = time.perf_counter()
         
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            latency_ms = (time.time() - start_time) * 1000
-            
-            # Assess based on response
-            if response.status_code == 200:
-                health = EndpointHealth.HEALTHY
-                reliability = 1.0
-                notes.append("Connection successful")
-            elif response.status_code < 400:
-                health = EndpointHealth.HEALTHY
-                reliability = 0.9
-                notes.append(f"Redirect/alternative response: {response.status_code}")
-            elif response.status_code < 500:
-                health = EndpointHealth.DEGRADED
-                reliability = 0.5
-                notes.append(f"Client error: {response.status_code}")
-            else:
-                health = EndpointHealth.UNHEALTHY
-                reliability = 0.2
-                notes.append(f"Server error: {response.status_code}")
+            # Only status and latency matter, so skip the body
+            response = self.session.head(
+                url, timeout=self.timeout, allow_redirects=True
+            )
+            if response.status_code in _HEAD_UNSUPPORTED:
+                response = self.session.get(url, timeout=self.timeout, stream=True)
+                response.close()
+            latency_ms = (time.perf_counter() - start) * 1000.0
+            return self._reading_from_status(response.status_code, latency_ms)
             
-            # Calculate f-score
-            latency_score = max(0, 1.0 - (latency_ms / 5000))  # 5s = 0
-            f_score = (reliability * 0.7) + (latency_score * 0.3)
+        except requests.exceptions.RetryError:
+            return self._retries_exhausted_reading()
             
         except requests.exceptions.Timeout:
-            latency_ms = self.timeout * 1000
-            health = EndpointHealth.UNHEALTHY
-            reliability = 0.0
-            f_score = 0.1
-            notes.append("Connection timeout - endpoint unreachable")
+            return self._timeout_reading()
             
         except requests.exceptions.ConnectionError:
-            latency_ms = 0
-            health = EndpointHealth.UNHEALTHY
-            reliability = 0.0
-            f_score = 0.0
-            notes.append("Connection failed - no route to host")
+            return self._connection_failed_reading()
             
         except Exception as e:
-            latency_ms = 0
-            health = EndpointHealth.UNKNOWN
-            reliability = 0.0
-            f_score = 0.1
-            notes.append(f"Unknown error: {str(e)[:50]}")
+            return self._unknown_error_reading(e)
+    
+    async def _perceive_async(self,
+                              session: 'aiohttp.ClientSession',
+                              url: str) -> ConnectionReading:
+        """Async counterpart of perceive_connection over a shared session"""
+        reading = self._cached_reading(url)
+        if reading is not None:
+            return reading
+        
+        start = time.perf_counter()
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        status = await self._status_with_retries(session, "HEAD", url, timeout)
+        if status in _HEAD_UNSUPPORTED:
+            status = await self._status_with_retries(session, "GET", url, timeout)
+        latency_ms = (time.perf_counter() - start) * 1000.0
+        reading = self._reading_from_status(status, latency_ms)
+        self._store_reading(url, reading)
+        return reading
+    
+    async def _status_with_retries(self,
+                                   session: 'aiohttp.ClientSession',
+                                   method: str,
+                                   url: str,
+                                   timeout: 'aiohttp.ClientTimeout') -> int:
+        """
+        Response status under the same policy as the sync Session's Retry.
+        
+        Forcelist statuses, connection errors and timeouts are retried up
+        to self.retries times with urllib3's backoff schedule; running out
+        on a status raises RetryError, as requests does.
+        """
+        for attempt in range(self.retries + 1):
+            # urllib3 does not sleep before the first retry
+            if attempt > 1:
+                await asyncio.sleep(min(
+                    self.backoff_factor * (2 ** (attempt - 1)), _RETRY_BACKOFF_MAX
+                ))
+            try:
+                # Leaving the context releases the connection unread
+                async with session.request(
+                    method, url, timeout=timeout, allow_redirects=True
+                ) as response:
+                    status = response.status
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+                continue
+            if status not in _RETRY_STATUS_FORCELIST:
+                return status
+        raise requests.exceptions.RetryError(
+            f"Max retries exceeded with url: {url} "
+            f"(too many {status} error responses)"
+        )
+    
+    def _reading_from_status(self,
+                             status_code: int,
+                             latency_ms: float) -> ConnectionReading:
+        """Map an HTTP status and latency onto an f-dimension reading."""
+        notes = []
+        
+        # Assess based on response
+        if status_code == 200:
+            health = EndpointHealth.HEALTHY
+            reliability = 1.0
+            notes.append("Connection successful")
+        elif status_code < 400:
+            health = EndpointHealth.HEALTHY
+            reliability = 0.9
+            notes.append(f"Redirect/alternative response: {status_code}")
+        elif status_code < 500:
+            health = EndpointHealth.DEGRADED
+            reliability = 0.5
+            notes.append(f"Client error: {status_code}")
+        else:
+            health = EndpointHealth.UNHEALTHY
+            reliability = 0.2
+            notes.append(f"Server error: {status_code}")
+        
+        # Calculate f-score
+        latency_score = max(0, 1.0 - (latency_ms / 5000))  # 5s = 0
+        f_score = (reliability * 0.7) + (latency_score * 0.3)
         
         return ConnectionReading(
-            f_score=round(f_score, 3),
-            latency_ms=round(latency_ms, 2),
+            f_score=f_score,
+            latency_ms=latency_ms,
             reliability=reliability,
             health=health,
             notes=notes
         )
     
+    def _timeout_reading(self) -> ConnectionReading:
+        return ConnectionReading(
+            f_score=0.1,
+            latency_ms=self.timeout * 1000,
+            reliability=0.0,
+            health=EndpointHealth.UNHEALTHY,
+            notes=["Connection timeout - endpoint unreachable"]
+        )
+    
+    @staticmethod
+    def _connection_failed_reading() -> ConnectionReading:
+        return ConnectionReading(
+            f_score=0.0,
+            latency_ms=0,
+            reliability=0.0,
+            health=EndpointHealth.UNHEALTHY,
+            notes=["Connection failed - no route to host"]
+        )
+    
+    @staticmethod
+    def _retries_exhausted_reading() -> ConnectionReading:
+        return ConnectionReading(
+            f_score=0.1,
+            latency_ms=0,
+            reliability=0.0,
+            health=EndpointHealth.UNKNOWN,
+            notes=["Retries exhausted - endpoint kept failing"]
+        )
+    
+    @staticmethod
+    def _unknown_error_reading(error: BaseException) -> ConnectionReading:
+        return ConnectionReading(
+            f_score=0.1,
+            latency_ms=0,
+            reliability=0.0,
+            health=EndpointHealth.UNKNOWN,
+            notes=[f"Unknown error: {str(error)[:50]}"]
+        )
+    
+    def _reading_from_async_error(self, error: BaseException) -> ConnectionReading:
+        """Map an exception from _perceive_async onto the sync-path readings."""
+        if isinstance(error, requests.exceptions.RetryError):
+            return self._retries_exhausted_reading()
+        if isinstance(error, asyncio.TimeoutError):
+            return self._timeout_reading()
+        if isinstance(error, aiohttp.ClientConnectionError):
+            return self._connection_failed_reading()
+        return self._unknown_error_reading(error)
+    
     def assess_ecosystem(self, urls: List[str]) -> IntegrationCoherence:
         """
         Assess overall ecosystem integration across multiple endpoints.
         
+        Probes go through self.session, so caller-set headers, auth,
+        proxies and adapters always apply.
+        
+        Args:
+            urls: List of endpoint URLs to assess
+            
+        Returns:
+            IntegrationCoherence with aggregate f-dimension
+        """
+        # Blocking probes release the GIL on socket I/O, so threads overlap them
+        workers = min(self.max_workers, len(urls))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                readings = list(executor.map(self.perceive_connection, urls))
+        else:
+            readings = [self.perceive_connection(url) for url in urls]
+        return self._integration_coherence(readings)
+    
+    async def assess_ecosystem_async(self, urls: List[str]) -> IntegrationCoherence:
+        """
+        Assess ecosystem integration with all probes in flight at once.
+        
+        Wall time is roughly the slowest endpoint rather than the sum
+        of all of them. Requires aiohttp.
+        
+        Probes use a fresh aiohttp session, not self.session: headers,
+        auth, cookies and adapters configured on the requests Session do
+        not apply here (proxy environment variables do).
+        
         Args:
             urls: List of endpoint URLs to assess
             
         Returns:
             IntegrationCoherence with aggregate f-dimension
         """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError(
+                "aiohttp not available. Install with: pip install aiohttp"
+            )
         if not urls:
+            return self._integration_coherence([])
+        
+        connector = aiohttp.TCPConnector(
+            limit=50, limit_per_host=10, ttl_dns_cache=300
+        )
+        async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
+            results = await asyncio.gather(
+                *(self._perceive_async(session, url) for url in urls),
+                return_exceptions=True
+            )
+        
+        readings = [
+            self._reading_from_async_error(result)
+            if isinstance(result, BaseException) else result
+            for result in results
+        ]
+        return self._integration_coherence(readings)
+    
+    @staticmethod
+    def _integration_coherence(readings: List[ConnectionReading]) -> IntegrationCoherence:
+        """Aggregate per-endpoint readings into ecosystem coherence."""
+        if not readings:
             return IntegrationCoherence(
                 overall_f=0.0,
                 endpoints_tested=0,
@@ -206,8 +491,6 @@ class EcosystemLens:
                 ecosystem_strength="none"
             )
         
-        readings = [self.perceive_connection(url) for url in urls]
-        
         healthy = sum(1 for r in readings if r.health == EndpointHealth.HEALTHY)
         degraded = sum(1 for r in readings if r.health == EndpointHealth.DEGRADED)
         failed = sum(1 for r in readings if r.health in 
@@ -225,7 +508,7 @@ class EcosystemLens:
         
         return IntegrationCoherence(
             overall_f=round(overall_f, 3),
-            endpoints_tested=len(urls),
+            endpoints_tested=len(readings),
             healthy_count=healthy,
             degraded_count=degraded,
             failed_count=failed,
@@ -233,8 +516,17 @@ class EcosystemLens:
         )
     
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """
+        Release this lens's hold on the shared connection pool.
+        
+        Pooled connections stay open while other lenses with the same
+        retry policy are still using them; the last close() shuts them.
+        Session.close() is not called because it would close the shared
+        adapter for everyone.
+        """
+        key, self._adapter_key = self._adapter_key, None
+        if key is not None:
+            _release_adapter(key)
     
     def __enter__(self):
         return self
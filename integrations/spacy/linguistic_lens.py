@@ -13,16 +13,21 @@ Transforms linguistic analysis into Rose Glass dimensional readings.
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import Counter
+from functools import lru_cache
 import math
 
 try:
+    import numpy as np
     import spacy
+    from spacy.attrs import POS, IS_ALPHA, IS_OOV, LOWER, LEMMA, LENGTH, HEAD
+    from spacy.parts_of_speech import IDS as POS_IDS
+    from spacy.strings import hash_string
     from spacy.tokens import Doc, Token, Span
     SPACY_AVAILABLE = True
 except ImportError:
     SPACY_AVAILABLE = False
     spacy = None
+    np = None
 
 
 class POSPattern(Enum):
@@ -34,7 +39,7 @@ class POSPattern(Enum):
     PRONOUN_HEAVY = "pronoun_heavy" # Personal, relational
 
 
-@dataclass
+@dataclass(slots=True)
 class LinguisticCoherence:
     """Syntactic coherence metrics."""
     sentence_consistency: float   # Consistency of sentence structure
@@ -51,7 +56,7 @@ class LinguisticCoherence:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class PsiReading:
     """Rose Glass Ψ-dimension reading from linguistic analysis."""
     psi: float                    # Overall Ψ-dimension (0.0-1.0)
@@ -79,6 +84,75 @@ class PsiReading:
 CONTENT_POS = {'NOUN', 'VERB', 'ADJ', 'ADV', 'PROPN'}
 FUNCTION_POS = {'DET', 'ADP', 'CCONJ', 'SCONJ', 'AUX', 'PART', 'PRON'}
 
+# Keyword sets for q-dimension activation
+FIRST_PERSON = frozenset({'i', 'me', 'my', 'we', 'us', 'our'})
+INTENSIFIERS = frozenset({'very', 'really', 'extremely', 'absolutely', 'totally', 'completely'})
+ACTIVATION_PUNCT = frozenset({'!', '?', '!?'})  # Texts matching `in '!?'`
+
+if SPACY_AVAILABLE:
+    # Doc.to_array columns, read once per document
+    _ARRAY_ATTRS = [POS, IS_ALPHA, IS_OOV, LOWER, LEMMA, LENGTH, HEAD]
+    (_COL_POS, _COL_ALPHA, _COL_OOV, _COL_LOWER,
+     _COL_LEMMA, _COL_LENGTH, _COL_HEAD) = range(7)
+    
+    _N_POS = max(POS_IDS.values()) + 1
+    _CONTENT_POS_IDS = np.array([POS_IDS[p] for p in sorted(CONTENT_POS)], dtype=np.intp)
+    
+    # LOWER hash ids for keyword matching. spaCy string hashes do not depend
+    # on the vocab, so they are computed once here rather than per lens.
+    FIRST_PERSON_HASHES = frozenset(hash_string(w) for w in FIRST_PERSON)
+    INTENSIFIER_HASHES = frozenset(hash_string(w) for w in INTENSIFIERS)
+    ACTIVATION_PUNCT_HASHES = frozenset(hash_string(w) for w in ACTIVATION_PUNCT)
+    
+    _FIRST_PERSON_IDS = np.fromiter(FIRST_PERSON_HASHES, dtype=np.uint64)
+    _INTENSIFIER_IDS = np.fromiter(INTENSIFIER_HASHES, dtype=np.uint64)
+    _ACTIVATION_PUNCT_IDS = np.fromiter(ACTIVATION_PUNCT_HASHES, dtype=np.uint64)
+
+# Per-token depth cap, as the original head-chasing loop applied
+MAX_DEPTH = 21
+
+# Pipeline components perceive() reads from (pos_, lemma_, head/sents, ents).
+# attribute_ruler stays: in the en_core_web_* models it maps tags to pos_.
+REQUIRED_PIPES = frozenset({
+    'tok2vec', 'transformer', 'tagger', 'morphologizer', 'attribute_ruler',
+    'lemmatizer', 'trainable_lemmatizer', 'parser', 'ner',
+})
+# fast_mode swaps the dependency parser for the much cheaper senter
+FAST_PIPES = (REQUIRED_PIPES - {'parser'}) | {'senter'}
+
+
+@lru_cache(maxsize=4)
+def _load_pipeline(model: str, fast_mode: bool = False) -> 'spacy.language.Language':
+    """
+    Load a spaCy model once per process, trimmed to REQUIRED_PIPES
+    (or FAST_PIPES in fast mode).
+    
+    spacy.load costs seconds; lenses on the same model share the result.
+    """
+    try:
+        nlp = spacy.load(model)
+    except OSError:
+        raise ImportError(
+            f"spaCy model '{model}' not found. Install with: "
+            f"python -m spacy download {model}"
+        )
+    
+    required = FAST_PIPES if fast_mode else REQUIRED_PIPES
+    for name in nlp.disabled:
+        if name in required:
+            nlp.enable_pipe(name)  # e.g. senter ships disabled
+    
+    # Skip per-token work from components nothing here reads
+    unused = [name for name in nlp.pipe_names if name not in required]
+    if unused:
+        nlp.select_pipes(disable=unused)
+    
+    # Without parser or senter, doc.sents needs rule-based boundaries
+    if fast_mode and 'senter' not in nlp.pipe_names:
+        nlp.add_pipe('sentencizer')
+    
+    return nlp
+
 
 class LinguisticLens:
     """
@@ -91,12 +165,19 @@ class LinguisticLens:
         "We don't parse grammar - we perceive coherent expression."
     """
     
-    def __init__(self, model: str = "en_core_web_sm"):
+    def __init__(self,
+                 model: str = "en_core_web_sm",
+                 max_chars: int = 100_000,
+                 fast_mode: bool = False):
         """
         Initialize linguistic lens.
         
         Args:
             model: spaCy model to use (default: en_core_web_sm)
+            max_chars: Longer texts are truncated to this many characters
+                before parsing (noted on the reading)
+            fast_mode: Skip the dependency parser (sentences come from
+                senter); Ψ is then weighted without dependency depth
         """
         if not SPACY_AVAILABLE:
             raise ImportError(
@@ -104,13 +185,12 @@ class LinguisticLens:
                 "python -m spacy download en_core_web_sm"
             )
         
-        try:
-            self.nlp = spacy.load(model)
-        except OSError:
-            raise ImportError(
-                f"spaCy model '{model}' not found. Install with: "
-                f"python -m spacy download {model}"
-            )
+        self.fast_mode = fast_mode
+        self.nlp = _load_pipeline(model, fast_mode)
+        
+        # The pipeline is shared, so only ever raise its length limit
+        self.max_chars = max_chars
+        self.nlp.max_length = max(self.nlp.max_length, max_chars + 1)
         
         self.model_name = model
     
@@ -125,30 +205,85 @@ class LinguisticLens:
             PsiReading with Ψ, q, ρ dimensions
         """
         if not text or not text.strip():
-            return PsiReading(
-                psi=0.0, rho=0.0, q=0.0,
-                coherence=LinguisticCoherence(0.0, 0.0, 0.0, 0.0),
-                pos_pattern=POSPattern.BALANCED,
-                entity_count=0,
-                confidence=0.0,
-                notes=["Empty text"]
-            )
+            return self._empty_reading()
+        
+        truncated = len(text) > self.max_chars
+        if truncated:
+            text = text[:self.max_chars]
+        
+        reading = self._reading_from_doc(self.nlp(text))
+        if truncated:
+            reading.notes.append(f"Truncated to {self.max_chars} chars")
+        return reading
+    
+    def perceive_batch(self,
+                       texts: List[str],
+                       batch_size: int = 64,
+                       n_process: int = 1) -> List[PsiReading]:
+        """
+        Perceive many texts through spaCy's batched pipeline.
         
-        doc = self.nlp(text)
+        Args:
+            texts: Texts to analyze
+            batch_size: Documents per nlp.pipe batch
+            n_process: Worker processes for nlp.pipe (-1 for all cores;
+                worthwhile for roughly 1000+ texts)
+            
+        Returns:
+            One PsiReading per text, in input order
+        """
+        readings: List[Optional[PsiReading]] = [None] * len(texts)
+        live = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                readings[i] = self._empty_reading()
+            else:
+                live.append(i)
+        
+        max_chars = self.max_chars
+        docs = self.nlp.pipe(
+            (texts[i][:max_chars] if len(texts[i]) > max_chars else texts[i]
+             for i in live),
+            batch_size=batch_size, n_process=n_process
+        )
+        for i, doc in zip(live, docs):
+            reading = self._reading_from_doc(doc)
+            if len(texts[i]) > max_chars:
+                reading.notes.append(f"Truncated to {max_chars} chars")
+            readings[i] = reading
+        
+        return readings
+    
+    @staticmethod
+    def _empty_reading() -> PsiReading:
+        return PsiReading(
+            psi=0.0, rho=0.0, q=0.0,
+            coherence=LinguisticCoherence(0.0, 0.0, 0.0, 0.0),
+            pos_pattern=POSPattern.BALANCED,
+            entity_count=0,
+            confidence=0.0,
+            notes=["Empty text"]
+        )
+    
+    def _reading_from_doc(self, doc: 'Doc') -> PsiReading:
+        """Run the Ψ/ρ/q analysis over an already parsed document."""
+        # Token attributes as one (n_tokens, n_attrs) uint64 array
+        arr = doc.to_array(_ARRAY_ATTRS)
+        pos_counts = np.bincount(arr[:, _COL_POS].astype(np.intp), minlength=_N_POS)
         
         # Calculate components
-        coherence = self._analyze_coherence(doc)
-        pos_pattern = self._analyze_pos_pattern(doc)
+        coherence = self._analyze_coherence(doc, arr, pos_counts)
+        pos_pattern = self._analyze_pos_pattern(pos_counts)
         entity_count = len(doc.ents)
         
         # Ψ from syntactic coherence
         psi = self._calculate_psi(coherence)
         
         # ρ from vocabulary sophistication
-        rho = self._calculate_rho(doc)
+        rho = self._calculate_rho(doc, arr)
         
         # q from entities and sentiment indicators
-        q = self._calculate_q(doc, entity_count)
+        q = self._calculate_q(doc, arr, entity_count)
         
         # Confidence based on text length
         confidence = min(0.95, 0.5 + len(doc) * 0.01)
@@ -166,50 +301,41 @@ class LinguisticLens:
             notes=notes
         )
     
-    def _analyze_coherence(self, doc: 'Doc') -> LinguisticCoherence:
+    def _analyze_coherence(self,
+                           doc: 'Doc',
+                           arr: 'np.ndarray',
+                           pos_counts: 'np.ndarray') -> LinguisticCoherence:
         """Analyze syntactic coherence of document."""
         if len(doc) == 0:
             return LinguisticCoherence(0.0, 0.0, 0.0, 0.0)
         
         # Sentence structure consistency
-        sent_lengths = [len(sent) for sent in doc.sents]
-        if len(sent_lengths) > 1:
-            mean_len = sum(sent_lengths) / len(sent_lengths)
-            variance = sum((l - mean_len)**2 for l in sent_lengths) / len(sent_lengths)
-            cv = math.sqrt(variance) / (mean_len + 0.01)
+        sent_lengths = np.fromiter((len(sent) for sent in doc.sents), dtype=np.int32)
+        if sent_lengths.size > 1:
+            cv = float(sent_lengths.std()) / (float(sent_lengths.mean()) + 0.01)
             sentence_consistency = 1.0 / (1.0 + cv)
         else:
             sentence_consistency = 0.7  # Neutral for single sentence
         
-        # Dependency tree depth
-        depths = []
-        for token in doc:
-            depth = 0
-            current = token
-            while current.head != current:
-                depth += 1
-                current = current.head
-                if depth > 20:  # Safety limit
-                    break
-            depths.append(depth)
-        avg_depth = sum(depths) / len(depths) if depths else 0
-        # Normalize: depth 3-5 is typical, map to 0-1
-        dependency_depth = min(1.0, avg_depth / 8.0)
+        # Dependency tree depth (no parse in fast mode)
+        if self.fast_mode:
+            dependency_depth = 0.0
+        else:
+            depths = self._dependency_depths(arr)
+            avg_depth = sum(min(d, MAX_DEPTH) for d in depths) / len(doc)
+            # Normalize: depth 3-5 is typical, map to 0-1
+            dependency_depth = min(1.0, avg_depth / 8.0)
         
         # POS distribution entropy
-        pos_counts = Counter(token.pos_ for token in doc)
-        total = sum(pos_counts.values())
-        if total > 0:
-            probs = [c / total for c in pos_counts.values()]
-            entropy = -sum(p * math.log(p + 1e-10) for p in probs)
-            max_entropy = math.log(len(pos_counts) + 1)
-            pos_entropy = entropy / max_entropy if max_entropy > 0 else 0
-        else:
-            pos_entropy = 0.0
+        present = pos_counts[pos_counts > 0]
+        probs = present / len(doc)  # Zero counts filtered, so log is safe
+        entropy = max(0.0, -float(np.sum(probs * np.log(probs))))
+        max_entropy = math.log(present.size + 1)
+        pos_entropy = entropy / max_entropy if max_entropy > 0 else 0
         
         # Lexical density
-        content_count = sum(1 for t in doc if t.pos_ in CONTENT_POS)
-        lexical_density = content_count / len(doc) if len(doc) > 0 else 0
+        content_count = int(pos_counts[_CONTENT_POS_IDS].sum())
+        lexical_density = content_count / len(doc)
         
         return LinguisticCoherence(
             sentence_consistency=float(sentence_consistency),
@@ -218,18 +344,44 @@ class LinguisticLens:
             lexical_density=float(lexical_density)
         )
     
-    def _analyze_pos_pattern(self, doc: 'Doc') -> POSPattern:
-        """Determine dominant POS pattern."""
-        pos_counts = Counter(token.pos_ for token in doc)
-        total = sum(pos_counts.values())
+    @staticmethod
+    def _dependency_depths(arr: 'np.ndarray') -> List[int]:
+        """
+        Depth of every token below its sentence root, in O(n).
+        
+        Each token is pushed at most once: chase heads until a token of
+        known depth (or a root) is reached, then unwind assigning depths.
+        """
+        # HEAD is stored as a relative offset in uint64 (two's complement)
+        heads = (np.arange(len(arr)) + arr[:, _COL_HEAD].astype(np.int64)).tolist()
+        depths = [-1] * len(heads)
+        
+        for i in range(len(heads)):
+            stack = []
+            j = i
+            while depths[j] < 0:
+                if heads[j] == j:
+                    depths[j] = 0
+                    break
+                stack.append(j)
+                j = heads[j]
+            depth = depths[j]
+            while stack:
+                depth += 1
+                depths[stack.pop()] = depth
         
+        return depths
+    
+    def _analyze_pos_pattern(self, pos_counts: 'np.ndarray') -> POSPattern:
+        """Determine dominant POS pattern."""
+        total = int(pos_counts.sum())
         if total == 0:
             return POSPattern.BALANCED
         
-        noun_ratio = (pos_counts.get('NOUN', 0) + pos_counts.get('PROPN', 0)) / total
-        verb_ratio = (pos_counts.get('VERB', 0) + pos_counts.get('AUX', 0)) / total
-        adj_ratio = pos_counts.get('ADJ', 0) / total
-        pron_ratio = pos_counts.get('PRON', 0) / total
+        noun_ratio = (pos_counts[POS_IDS['NOUN']] + pos_counts[POS_IDS['PROPN']]) / total
+        verb_ratio = (pos_counts[POS_IDS['VERB']] + pos_counts[POS_IDS['AUX']]) / total
+        adj_ratio = pos_counts[POS_IDS['ADJ']] / total
+        pron_ratio = pos_counts[POS_IDS['PRON']] / total
         
         # Determine dominant pattern
         if noun_ratio > 0.35:
@@ -245,6 +397,15 @@ class LinguisticLens:
     
     def _calculate_psi(self, coherence: LinguisticCoherence) -> float:
         """Calculate Ψ-dimension from coherence metrics."""
+        if self.fast_mode:
+            # No dependency depth: spread its 0.20 over the other terms
+            psi = (
+                coherence.sentence_consistency * 0.30 +
+                coherence.pos_entropy * 0.25 +
+                coherence.lexical_density * 0.25
+            ) / 0.80
+            return max(0.0, min(1.0, psi))
+        
         # Weighted combination
         psi = (
             coherence.sentence_consistency * 0.30 +
@@ -254,50 +415,56 @@ class LinguisticLens:
         )
         return max(0.0, min(1.0, psi))
     
-    def _calculate_rho(self, doc: 'Doc') -> float:
+    def _calculate_rho(self, doc: 'Doc', arr: 'np.ndarray') -> float:
         """Calculate ρ-dimension from vocabulary sophistication."""
         if len(doc) == 0:
             return 0.0
         
-        # Type-token ratio (vocabulary diversity)
-        lemmas = [token.lemma_.lower() for token in doc if token.is_alpha]
-        if len(lemmas) == 0:
+        alpha = arr[:, _COL_ALPHA].astype(bool)
+        alpha_count = int(alpha.sum())
+        if alpha_count == 0:
             return 0.0
-        ttr = len(set(lemmas)) / len(lemmas)
+        
+        # Type-token ratio (vocabulary diversity); only distinct lemma
+        # hashes are turned back into strings for case folding
+        strings = doc.vocab.strings
+        lemma_ids = np.unique(arr[alpha, _COL_LEMMA]).tolist()
+        ttr = len({strings[h].lower() for h in lemma_ids}) / alpha_count
         
         # Average word length (proxy for sophistication)
-        word_lengths = [len(token.text) for token in doc if token.is_alpha]
-        avg_length = sum(word_lengths) / len(word_lengths) if word_lengths else 0
+        avg_length = int(arr[alpha, _COL_LENGTH].sum()) / alpha_count
         length_score = min(1.0, avg_length / 8.0)  # 8+ char avg is sophisticated
         
         # Rare word ratio (not in most common)
         # Using word frequency if available
-        rare_count = sum(1 for t in doc if t.is_alpha and t.is_oov)
-        rare_ratio = rare_count / len([t for t in doc if t.is_alpha]) if len(doc) > 0 else 0
+        rare_count = int(arr[alpha, _COL_OOV].sum())
+        rare_ratio = rare_count / alpha_count
         
         rho = ttr * 0.4 + length_score * 0.3 + rare_ratio * 0.3
         return max(0.0, min(1.0, rho))
     
-    def _calculate_q(self, doc: 'Doc', entity_count: int) -> float:
+    def _calculate_q(self, doc: 'Doc', arr: 'np.ndarray', entity_count: int) -> float:
         """Calculate q-dimension from emotional activation indicators."""
         if len(doc) == 0:
             return 0.0
         
+        lower = arr[:, _COL_LOWER]
+        
         # Entity density (named entities suggest engagement)
         entity_density = min(1.0, entity_count / (len(doc) / 10 + 1))
         
         # Exclamation/question marks (activation markers)
-        punct_activation = sum(1 for t in doc if t.text in '!?') / (len(doc) + 1)
+        punct_count = int(np.isin(lower, _ACTIVATION_PUNCT_IDS).sum())
+        punct_activation = punct_count / (len(doc) + 1)
         punct_score = min(1.0, punct_activation * 10)
         
         # First person pronouns (personal engagement)
-        first_person = sum(1 for t in doc if t.lower_ in {'i', 'me', 'my', 'we', 'us', 'our'})
+        first_person = int(np.isin(lower, _FIRST_PERSON_IDS).sum())
         personal_ratio = first_person / len(doc)
         personal_score = min(1.0, personal_ratio * 5)
         
         # Intensifiers
-        intensifiers = {'very', 'really', 'extremely', 'absolutely', 'totally', 'completely'}
-        intensifier_count = sum(1 for t in doc if t.lower_ in intensifiers)
+        intensifier_count = int(np.isin(lower, _INTENSIFIER_IDS).sum())
         intensifier_score = min(1.0, intensifier_count / (len(doc) / 20 + 1))
         
         q = (
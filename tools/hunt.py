@@ -9,32 +9,90 @@ Created: January 2026
 Usage:
     python hunt.py <repo_url>
     python hunt.py https://github.com/psf/requests
+    python hunt.py <repo_url> --no-cache
+
+Reports are cached under ~/.cache/cerata/hunt, keyed by the remote HEAD commit.
 """
 
 import sys
+import ast
+import hashlib
+import heapq
 import subprocess
 import tempfile
 import json
 import os
+import re
+import warnings
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-# Add Rose Glass path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "rose-glass/src"))
+# Rose Glass checkout; imported on first use so CLI startup stays cheap
+ROSE_GLASS_PATH = Path(__file__).parent.parent.parent.parent / "rose-glass/src"
 
-try:
-    from core.unified_lens import get_lens
-    ROSE_GLASS_AVAILABLE = True
-except ImportError:
-    print("Warning: Rose Glass not available, using fallback analysis")
-    ROSE_GLASS_AVAILABLE = False
 
+@lru_cache(maxsize=1)
+def _get_lens():
+    """Import Rose Glass and return its lens, or None if it is unavailable."""
+    sys.path.insert(0, str(ROSE_GLASS_PATH))
+    try:
+        from core.unified_lens import get_lens
+    except ImportError:
+        print("Warning: Rose Glass not available, using fallback analysis")
+        return None
+    return get_lens()
 
-def analyze_repo_structure(repo_path: Path) -> Dict:
-    """Analyze repository structure for coherence indicators."""
-    
-    structure = {
+
+CERATA_CACHE = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'cerata'
+# Finished reports, keyed by the remote HEAD commit they were computed from
+CACHE_DIR = CERATA_CACHE / 'hunt'
+CACHE_MAX_ENTRIES = 500
+# Bump when the analysis or report format changes, so reports from older code miss
+_REPORT_CACHE_VERSION = 'v1'
+# Per-file quality counters, keyed by a hash of the file contents (used by hunt())
+FILE_STATS_DIR = CERATA_CACHE / 'file_stats'
+FILE_STATS_MAX_ENTRIES = 50000
+# Bump when the per-file counters change meaning, so stale entries miss
+_FILE_STATS_PERSON = b'cerata-stats-v1'
+
+# RAM-backed scratch space for clones, when the platform provides one
+SCRATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# Per-file read cap; generated files past this size add I/O, not signal
+MAX_READ_BYTES = 256 * 1024
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0)
+
+# Below this many .py files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 200
+
+# Never let git block on a credential prompt (e.g. private or mistyped URLs)
+GIT_ENV = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+
+# Directories pruned before descending (VCS data, caches, vendored deps, build output)
+IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv', 'dist', 'build'
+})
+TEST_DIRS = frozenset({'tests', 'test', '__tests__', 'spec'})
+CI_DIRS = frozenset({'.github', '.gitlab-ci', '.circleci'})
+CONFIG_FILES = frozenset({'setup.py', 'pyproject.toml', 'package.json', 'cargo.toml'})
+REQUIREMENTS_FILES = frozenset({'requirements.txt', 'pyproject.toml', 'package.json'})
+README_FILES = frozenset({'readme.md', 'readme.rst'})
+# Extension (without the dot) -> structure counter, checked before name rules
+SUFFIX_TO_BUCKET = {
+    'py': 'python_files',
+    'js': 'js_files',
+    'ts': 'js_files',
+    'jsx': 'js_files',
+    'tsx': 'js_files',
+}
+DOC_SUFFIXES = frozenset({'md', 'rst', 'txt'})
+
+
+def _new_structure() -> Dict:
+    return {
         'total_files': 0,
         'python_files': 0,
         'js_files': 0,
@@ -48,49 +106,10 @@ def analyze_repo_structure(repo_path: Path) -> Dict:
         'has_requirements': False,
         'directories': []
     }
-    
-    for f in repo_path.rglob('*'):
-        if '.git' in str(f):
-            continue
-            
-        if f.is_file():
-            structure['total_files'] += 1
-            name = f.name.lower()
-            
-            if name.endswith('.py'):
-                structure['python_files'] += 1
-            elif name.endswith(('.js', '.ts', '.jsx', '.tsx')):
-                structure['js_files'] += 1
-            elif 'test' in name or 'spec' in name:
-                structure['test_files'] += 1
-            elif name.endswith(('.md', '.rst', '.txt')):
-                structure['doc_files'] += 1
-            elif name in ('setup.py', 'pyproject.toml', 'package.json', 'cargo.toml'):
-                structure['config_files'] += 1
-            
-            if name == 'readme.md' or name == 'readme.rst':
-                structure['has_readme'] = True
-            if name == 'license' or name.startswith('license.'):
-                structure['has_license'] = True
-            if name in ('requirements.txt', 'pyproject.toml', 'package.json'):
-                structure['has_requirements'] = True
-                
-        if f.is_dir():
-            dir_name = f.name.lower()
-            if dir_name not in ['.git', '__pycache__', 'node_modules', '.venv', 'venv']:
-                structure['directories'].append(dir_name)
-            if dir_name in ['tests', 'test', '__tests__', 'spec']:
-                structure['has_tests'] = True
-            if dir_name in ['.github', '.gitlab-ci', '.circleci']:
-                structure['has_ci'] = True
-    
-    return structure
 
 
-def analyze_code_quality(repo_path: Path) -> Dict:
-    """Analyze code quality indicators."""
-    
-    quality = {
+def _new_quality() -> Dict:
+    return {
         'total_lines': 0,
         'comment_lines': 0,
         'docstring_count': 0,
@@ -99,36 +118,412 @@ def analyze_code_quality(repo_path: Path) -> Dict:
         'import_count': 0,
         'type_hint_count': 0
     }
+
+
+def _classify_file(structure: Dict, name: str) -> Optional[str]:
+    """Update structure counters for one (lowercased) file name; returns its bucket."""
+    structure['total_files'] += 1
+    
+    _, dot, suffix = name.rpartition('.')
+    bucket = SUFFIX_TO_BUCKET.get(suffix) if dot else None
+    if bucket is None:
+        if 'test' in name or 'spec' in name:
+            bucket = 'test_files'
+        elif dot and suffix in DOC_SUFFIXES:
+            bucket = 'doc_files'
+        elif name in CONFIG_FILES:
+            bucket = 'config_files'
+    if bucket is not None:
+        structure[bucket] += 1
+    
+    if name in README_FILES:
+        structure['has_readme'] = True
+    if name.partition('.')[0] == 'license':
+        structure['has_license'] = True
+    if name in REQUIREMENTS_FILES:
+        structure['has_requirements'] = True
+    return bucket
+
+
+def _classify_dir(structure: Dict, dir_name: str):
+    """Update structure flags for one (lowercased, non-ignored) directory."""
+    structure['directories'].append(dir_name)
+    if dir_name in TEST_DIRS:
+        structure['has_tests'] = True
+    if dir_name in CI_DIRS:
+        structure['has_ci'] = True
+
+
+# Per-line quality markers, matched over whole files instead of line by line.
+# Comment/def/class/import are mutually exclusive at a line start, so one
+# alternation counts them all; _count_quality prepends '\n' so line 1 matches too.
+_LINE_START_RE = re.compile(rb'\n[ \t\f\v\r]*(#|def |class |import |from )')
+_LINE_START_KEYS = {
+    b'#': 'comment_lines',
+    b'def ': 'function_count',
+    b'class ': 'class_count',
+    b'import ': 'import_count',
+    b'from ': 'import_count',
+}
+# The match runs to end of line, so each docstring line is counted once
+_DOCSTRING_RE = re.compile(rb'(?:"""|\'\'\')[^\n]*')
+
+
+def _count_type_hint_lines(content: bytes) -> int:
+    """Count lines holding both '->' and ': ' (after stripping)."""
+    count = 0
+    line_end = -1
+    pos = content.find(b'->')
+    while pos != -1:
+        if pos > line_end:
+            line_start = content.rfind(b'\n', 0, pos) + 1
+            line_end = content.find(b'\n', pos)
+            if line_end == -1:
+                line_end = len(content)
+            if b': ' in content[line_start:line_end].strip():
+                count += 1
+        pos = content.find(b'->', pos + 2)
+    return count
+
+
+def _count_quality(quality: Dict, content: bytes):
+    """Update code quality counters from one file's raw bytes."""
+    quality['total_lines'] += content.count(b'\n') + 1
+    
+    for marker in _LINE_START_RE.findall(b'\n' + content):
+        quality[_LINE_START_KEYS[marker]] += 1
+    quality['docstring_count'] += len(_DOCSTRING_RE.findall(content))
+    quality['type_hint_count'] += _count_type_hint_lines(content)
+
+
+def _ast_counts(content: bytes) -> Optional[Tuple[int, int, int]]:
+    """Exact (functions, classes, type annotations) from the AST, or None."""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            tree = ast.parse(content)
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+    
+    functions = classes = annotations = 0
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions += 1
+            if node.returns is not None:
+                annotations += 1
+        elif isinstance(node, ast.ClassDef):
+            classes += 1
+        elif isinstance(node, ast.arg) and node.annotation is not None:
+            annotations += 1
+    return functions, classes, annotations
+
+
+def _file_stats(content: bytes, stats_dir: Optional[Path]) -> Dict:
+    """
+    Quality counters for one file, memoized on disk by content hash.
     
-    for py_file in repo_path.rglob('*.py'):
-        if '.git' in str(py_file) or '__pycache__' in str(py_file):
-            continue
-            
+    Function, class and type-hint counts come from the AST when the file
+    parses; otherwise the line-marker counts are kept. Identical files
+    (e.g. across forks) are only analyzed once.
+    """
+    digest = hashlib.blake2b(content, digest_size=16, person=_FILE_STATS_PERSON).hexdigest()
+    cache_file = stats_dir / digest[:2] / f"{digest}.json" if stats_dir else None
+    if cache_file is not None:
+        try:
+            return json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass
+    
+    stats = _new_quality()
+    _count_quality(stats, content)
+    counts = _ast_counts(content)
+    if counts is not None:
+        stats['function_count'], stats['class_count'], stats['type_hint_count'] = counts
+    
+    if cache_file is not None:
+        try:
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            data = json.dumps(stats).encode('utf-8')
+            try:
+                tmp_file.write_bytes(data)
+            except FileNotFoundError:
+                # First entry in this shard; only then pay for the mkdir
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_bytes(data)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    return stats
+
+
+def _trim_file_stats(stats_dir: Path):
+    """Evict the oldest per-file entries beyond FILE_STATS_MAX_ENTRIES."""
+    try:
+        entries = list(stats_dir.glob('*/*.json'))
+        if len(entries) <= FILE_STATS_MAX_ENTRIES:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-FILE_STATS_MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        # Best effort, like the report cache; retried on the next hunt
+        pass
+
+
+def _nematocyst_candidate(rel_path: str, content: bytes, lines: int) -> Optional[Dict]:
+    """Score one non-test source file as a nematocyst candidate."""
+    # Count useful indicators
+    functions = content.count(b'\ndef ')
+    classes = content.count(b'\nclass ')
+    
+    if functions + classes == 0:
+        return None
+    return {
+        'path': rel_path,
+        'functions': functions,
+        'classes': classes,
+        'lines': lines,
+        'score': (functions * 2 + classes * 3) / max(lines / 100, 1)
+    }
+
+
+def _read_source(path: str, size: Optional[int] = None) -> Tuple[bytes, bool]:
+    """
+    Read at most MAX_READ_BYTES of a file: (content, truncated).
+    
+    A known size (from the scandir entry) sizes the single os.read call.
+    Truncated content is cut back to the last complete line.
+    """
+    limit = MAX_READ_BYTES if size is None else min(size, MAX_READ_BYTES)
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        content = os.read(fd, limit + 1)
+    finally:
+        os.close(fd)
+    if len(content) <= MAX_READ_BYTES:
+        return content, False
+    cut = content.rfind(b'\n', 0, MAX_READ_BYTES) + 1
+    return content[:cut or MAX_READ_BYTES], True
+
+
+def _scan_source(quality: Dict, candidates: List[Dict], path: str, rel_path: str,
+                 size: Optional[int] = None, stats_dir: Optional[Path] = None):
+    """
+    Feed one .py file into the quality counters and candidate list.
+    
+    Oversized files only contribute their first MAX_READ_BYTES; their
+    candidates are marked as truncated.
+    """
+    content, truncated = _read_source(path, size)
+    lines = content.count(b'\n') + 1
+    
+    for key, value in _file_stats(content, stats_dir).items():
+        quality[key] += value
+    
+    if 'test' in rel_path.lower() or 'setup.py' in rel_path:
+        return
+    candidate = _nematocyst_candidate(rel_path, content, lines)
+    if candidate is not None:
+        if truncated:
+            candidate['truncated'] = True
+        candidates.append(candidate)
+
+
+def _analyze_one_py(job: Tuple[str, str, Optional[int]],
+                    stats_dir: Optional[Path] = None) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """Read and score one .py file: (quality counters, candidate or None)."""
+    path, rel_path, size = job
+    quality = _new_quality()
+    candidates = []
+    try:
+        _scan_source(quality, candidates, path, rel_path, size, stats_dir)
+    except Exception:
+        return None, None
+    return quality, candidates[0] if candidates else None
+
+
+def _analyze_py_files(jobs: List[Tuple[str, str, Optional[int]]], quality: Dict, candidates: List[Dict],
+                      stats_dir: Optional[Path] = None):
+    """
+    Analyze (path, rel_path, size) jobs, across processes for large repositories.
+    
+    Files are independent, so results are simply summed; ex.map keeps them
+    in job order, which keeps candidate tie-breaking identical to a serial run.
+    """
+    workers = os.cpu_count() or 1
+    if len(jobs) < PARALLEL_MIN_FILES or workers < 2:
+        for path, rel_path, size in jobs:
+            try:
+                _scan_source(quality, candidates, path, rel_path, size, stats_dir)
+            except Exception:
+                continue
+        return
+    
+    # Deferred: pulls in multiprocessing, which small scans never need
+    from concurrent.futures import ProcessPoolExecutor
+    
+    chunksize = max(1, len(jobs) // (workers * 4))
+    analyze = partial(_analyze_one_py, stats_dir=stats_dir)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for file_quality, candidate in executor.map(analyze, jobs, chunksize=chunksize):
+            if file_quality is None:
+                continue
+            for key, value in file_quality.items():
+                quality[key] += value
+            if candidate is not None:
+                candidates.append(candidate)
+
+
+def scan_repo(repo_path: Path, max_candidates: int = 15,
+              stats_dir: Optional[Path] = None) -> Tuple[Dict, Dict, List[Dict]]:
+    """
+    Walk a repository once for structure, code quality and nematocysts.
+    
+    Ignored directories are pruned before descending, and each .py file
+    is read a single time (in worker processes for large repositories) to
+    feed both the quality counters and the nematocyst score. Files are read as raw bytes and never decoded: every
+    marker is ASCII, and UTF-8 multi-byte sequences cannot contain ASCII
+    bytes, so counting on bytes matches counting on the decoded text.
+    
+    Returns:
+        (structure, quality, nematocyst_candidates)
+    """
+    structure = _new_structure()
+    quality = _new_quality()
+    candidates = []
+    jobs = []
+    
+    root = os.fspath(repo_path)
+    # entry.path always starts with root, so relative paths are a slice
+    prefix_len = len(root.rstrip(os.sep) + os.sep)
+    pending = [root]
+    while pending:
         try:
-            content = py_file.read_text(encoding='utf-8', errors='ignore')
-            lines = content.split('\n')
-            
-            quality['total_lines'] += len(lines)
-            
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith('#'):
-                    quality['comment_lines'] += 1
-                if stripped.startswith('def '):
-                    quality['function_count'] += 1
-                if stripped.startswith('class '):
-                    quality['class_count'] += 1
-                if stripped.startswith(('import ', 'from ')):
-                    quality['import_count'] += 1
-                if '"""' in stripped or "'''" in stripped:
-                    quality['docstring_count'] += 1
-                if ': ' in stripped and '->' in stripped:
-                    quality['type_hint_count'] += 1
-                    
-        except Exception:
+            entries = os.scandir(pending.pop())
+        except OSError:
             continue
+        
+        with entries:
+            for entry in entries:
+                name = entry.name.lower()
+                
+                if entry.is_dir(follow_symlinks=False):
+                    if name in IGNORED_DIRS:
+                        continue
+                    _classify_dir(structure, name)
+                    pending.append(entry.path)
+                    continue
+                
+                if not entry.is_file():
+                    continue
+                if _classify_file(structure, name) != 'python_files':
+                    continue
+                
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = None
+                jobs.append((entry.path, entry.path[prefix_len:], size))
+    
+    _analyze_py_files(jobs, quality, candidates, stats_dir)
+    
+    # Keep top candidates by score (same order as a stable descending sort)
+    return structure, quality, heapq.nlargest(max_candidates, candidates, key=lambda x: x['score'])
+
+
+def scan_git_tree(repo_path: Path, max_candidates: int = 15,
+                  stats_dir: Optional[Path] = None) -> Tuple[Dict, Dict, List[Dict]]:
+    """
+    Scan a clone from its HEAD tree listing instead of the working tree.
+    
+    Structure is derived from `git ls-tree`, so only the .py files have to
+    be checked out (see _clone_sources). Falls back to scan_repo when the
+    tree cannot be listed.
+    
+    Returns:
+        (structure, quality, nematocyst_candidates)
+    """
+    result = subprocess.run(
+        ['git', '-C', os.fspath(repo_path), 'ls-tree', '-r', '-t', '-z', 'HEAD'],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=GIT_ENV
+    )
+    if result.returncode != 0:
+        return scan_repo(repo_path, max_candidates, stats_dir)
+    
+    structure = _new_structure()
+    quality = _new_quality()
+    candidates = []
+    jobs = []
+    
+    for record in result.stdout.split(b'\0'):
+        if not record:
+            continue
+        meta, _, raw_path = record.partition(b'\t')
+        obj_type = meta.split()[1]
+        rel_path = os.fsdecode(raw_path)
+        parts = rel_path.lower().split('/')
+        name = parts[-1]
+        
+        if any(part in IGNORED_DIRS for part in parts[:-1]):
+            continue
+        if obj_type == b'tree':
+            if name not in IGNORED_DIRS:
+                _classify_dir(structure, name)
+            continue
+        if obj_type != b'blob':
+            continue
+        
+        if _classify_file(structure, name) != 'python_files':
+            continue
+        
+        # Blob sizes are not queried: in a partial clone that would fetch them
+        jobs.append((os.path.join(repo_path, rel_path), rel_path, None))
+    
+    _analyze_py_files(jobs, quality, candidates, stats_dir)
+    
+    return structure, quality, heapq.nlargest(max_candidates, candidates, key=lambda x: x['score'])
+
+
+def analyze_repo_structure(repo_path: Path) -> Dict:
+    """Analyze repository structure for coherence indicators."""
+    return scan_repo(repo_path)[0]
+
+
+def analyze_code_quality(repo_path: Path) -> Dict:
+    """Analyze code quality indicators."""
+    return scan_repo(repo_path)[1]
+
+
+def identify_nematocysts(repo_path: Path, max_candidates: int = 15) -> List[Dict]:
+    """Identify potential nematocyst candidates (useful code to extract)."""
+    return scan_repo(repo_path, max_candidates)[2]
+
+
+def _fallback_coherence(psi, rho, q, f):
+    """Unclamped fallback coherence formula; works on floats or NumPy arrays."""
+    q_opt = q / (0.2 + q + (q**2 / 0.8))
+    return psi + (rho * psi) + q_opt + (f * psi) + (0.15 * rho * q_opt)
+
+
+def coherence_vec(psi, rho, q, f) -> 'np.ndarray':
+    """
+    Fallback coherence for many repositories at once.
     
-    return quality
+    Takes one array per dimension (one entry per repo) and evaluates the
+    formula in a single vectorized pass, clamped to 4.0.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("NumPy required. Install: pip install numpy") from None
+    
+    coherence = _fallback_coherence(
+        np.asarray(psi, dtype=np.float64),
+        np.asarray(rho, dtype=np.float64),
+        np.asarray(q, dtype=np.float64),
+        np.asarray(f, dtype=np.float64)
+    )
+    return np.minimum(coherence, 4.0, out=coherence)
 
 
 def calculate_repo_coherence(structure: Dict, quality: Dict) -> Dict:
@@ -181,14 +576,12 @@ def calculate_repo_coherence(structure: Dict, quality: Dict) -> Dict:
         f += 0.05
     
     # Calculate coherence using Rose Glass formula
-    if ROSE_GLASS_AVAILABLE:
-        lens = get_lens()
+    lens = _get_lens()
+    if lens is not None:
         coherence = lens.calculate_coherence(psi, rho, q, f)
     else:
         # Fallback calculation
-        q_opt = q / (0.2 + q + (q**2 / 0.8))
-        coherence = psi + (rho * psi) + q_opt + (f * psi) + (0.15 * rho * q_opt)
-        coherence = min(coherence, 4.0)
+        coherence = min(_fallback_coherence(psi, rho, q, f), 4.0)
     
     return {
         'psi': round(min(psi, 1.0), 3),
@@ -199,45 +592,6 @@ def calculate_repo_coherence(structure: Dict, quality: Dict) -> Dict:
     }
 
 
-def identify_nematocysts(repo_path: Path, max_candidates: int = 15) -> List[Dict]:
-    """Identify potential nematocyst candidates (useful code to extract)."""
-    
-    candidates = []
-    
-    for py_file in repo_path.rglob('*.py'):
-        if '.git' in str(py_file) or '__pycache__' in str(py_file):
-            continue
-        if 'test' in str(py_file).lower():
-            continue
-        if 'setup.py' in str(py_file):
-            continue
-            
-        try:
-            content = py_file.read_text(encoding='utf-8', errors='ignore')
-            rel_path = str(py_file.relative_to(repo_path))
-            
-            # Count useful indicators
-            functions = content.count('\ndef ')
-            classes = content.count('\nclass ')
-            lines = len(content.split('\n'))
-            
-            if functions + classes > 0:
-                candidates.append({
-                    'path': rel_path,
-                    'functions': functions,
-                    'classes': classes,
-                    'lines': lines,
-                    'score': (functions * 2 + classes * 3) / max(lines / 100, 1)
-                })
-                
-        except Exception:
-            continue
-    
-    # Sort by score and return top candidates
-    candidates.sort(key=lambda x: x['score'], reverse=True)
-    return candidates[:max_candidates]
-
-
 def determine_viability(coherence: Dict) -> Dict:
     """Determine prey viability based on coherence analysis."""
     
@@ -279,22 +633,125 @@ def determine_viability(coherence: Dict) -> Dict:
     }
 
 
-def hunt(repo_url: str) -> Dict:
+def _remote_head_sha(repo_url: str) -> Optional[str]:
+    """Resolve the remote HEAD commit without cloning (None if unavailable)."""
+    try:
+        result = subprocess.run(
+            ['git', 'ls-remote', '--quiet', repo_url, 'HEAD'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+            env=GIT_ENV, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    if result.returncode != 0 or not result.stdout:
+        return None
+    sha = result.stdout.split()[0]
+    if len(sha) != 40 or any(c not in '0123456789abcdef' for c in sha):
+        return None
+    return sha
+
+
+def _report_cache_file(sha: str) -> Path:
+    """Cache path for a commit's report under the current analysis version."""
+    return CACHE_DIR / f"{sha}-{_REPORT_CACHE_VERSION}.json"
+
+
+def _load_cached_report(sha: str) -> Optional[Dict]:
+    """Return the cached report for a commit, refreshing its LRU position."""
+    cache_file = _report_cache_file(sha)
+    try:
+        report = json.loads(cache_file.read_text(encoding='utf-8'))
+        os.utime(cache_file)
+    except (OSError, ValueError):
+        return None
+    return report
+
+
+def _store_report(sha: str, report: Dict):
+    """Atomically write a report to the cache and evict the oldest entries."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=CACHE_DIR, suffix='.tmp', delete=False
+        ) as tmp:
+            json.dump(report, tmp, default=str)
+        os.replace(tmp.name, _report_cache_file(sha))
+        
+        entries = sorted(CACHE_DIR.glob('*.json'), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-CACHE_MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        # Caching is best effort; the report itself is already computed
+        pass
+
+
+def hunt(repo_url: str, use_cache: bool = True) -> Dict:
     """
     Hunt a repository: clone, analyze, report.
     
+    When use_cache is set, the remote HEAD is resolved with git ls-remote
+    first and a report already computed for that commit is returned
+    without cloning.
+    
     Returns full CERATA perception analysis.
     """
     print(f"🎯 HUNTING: {repo_url}")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Clone repo (shallow)
-        print("Cloning repository...")
-        result = subprocess.run(
-            ['git', 'clone', '--depth', '1', '--quiet', repo_url, tmpdir],
-            capture_output=True, text=True
+    head_sha = _remote_head_sha(repo_url) if use_cache else None
+    if head_sha:
+        cached = _load_cached_report(head_sha)
+        if cached is not None:
+            print(f"Using cached analysis for {head_sha[:12]}")
+            cached['url'] = repo_url
+            return cached
+    
+    report = _hunt_uncached(repo_url, FILE_STATS_DIR if use_cache else None)
+    if use_cache:
+        _trim_file_stats(FILE_STATS_DIR)
+    if head_sha and 'error' not in report:
+        _store_report(head_sha, report)
+    return report
+
+
+def _clone_sources(repo_url: str, dest: str) -> subprocess.CompletedProcess:
+    """
+    Shallow partial clone that only materializes .py files.
+    
+    Blobs are skipped at clone time (--filter=blob:none); the sparse
+    checkout then fetches just the .py blobs in one batch. If sparse
+    checkout is unavailable the full HEAD is checked out instead.
+    """
+    result = subprocess.run(
+        ['git', 'clone', '--filter=blob:none', '--no-checkout', '--depth', '1',
+         '--quiet', repo_url, dest],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=GIT_ENV
+    )
+    if result.returncode != 0:
+        return result
+    
+    sparse = subprocess.run(
+        ['git', '-C', dest, 'sparse-checkout', 'set', '--no-cone', '*.py'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=GIT_ENV
+    )
+    if sparse.returncode != 0:
+        subprocess.run(
+            ['git', '-C', dest, 'sparse-checkout', 'disable'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=GIT_ENV
         )
+    return subprocess.run(
+        ['git', '-C', dest, 'checkout', '--quiet'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=GIT_ENV
+    )
+
+
+def _hunt_uncached(repo_url: str, stats_dir: Optional[Path] = None) -> Dict:
+    """Clone and analyze a repository from scratch."""
+    with tempfile.TemporaryDirectory(dir=SCRATCH_DIR) as tmpdir:
+        # Clone repo (shallow, partial)
+        print("Cloning repository...")
+        result = _clone_sources(repo_url, tmpdir)
         
         if result.returncode != 0:
             return {
@@ -305,18 +762,12 @@ def hunt(repo_url: str) -> Dict:
         
         repo_path = Path(tmpdir)
         
-        print("Analyzing structure...")
-        structure = analyze_repo_structure(repo_path)
-        
-        print("Analyzing code quality...")
-        quality = analyze_code_quality(repo_path)
+        print("Scanning structure, code quality and nematocysts...")
+        structure, quality, nematocysts = scan_git_tree(repo_path, stats_dir=stats_dir)
         
         print("Calculating coherence...")
         coherence = calculate_repo_coherence(structure, quality)
         
-        print("Identifying nematocysts...")
-        nematocysts = identify_nematocysts(repo_path)
-        
         print("Determining viability...")
         viability = determine_viability(coherence)
         
@@ -395,7 +846,7 @@ def main():
     """Main entry point."""
     if len(sys.argv) < 2:
         print("CERATA Hunt Protocol")
-        print("Usage: python hunt.py <repo_url>")
+        print("Usage: python hunt.py <repo_url> [--json] [--no-cache]")
         print("Example: python hunt.py https://github.com/psf/requests")
         sys.exit(1)
     
@@ -405,7 +856,7 @@ def main():
     if not repo_url.startswith('http'):
         repo_url = f"https://github.com/{repo_url}"
     
-    report = hunt(repo_url)
+    report = hunt(repo_url, use_cache='--no-cache' not in sys.argv)
     print_report(report)
     
     # Also output JSON for programmatic use
@@ -18,15 +18,90 @@ License: MIT
 """
 
 import re
+import bisect
 import hashlib
 import json
+import os
+import queue
+import shelve
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import islice
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Iterator, Optional, Pattern, Tuple, Union
 from enum import Enum
 from datetime import datetime
-from urllib.parse import urlparse, parse_qs
+from pathlib import Path
+from urllib.parse import ParseResult, urlparse, parse_qs
 import html.parser
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
+try:
+    from rapidfuzz.distance import Levenshtein as RapidLevenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    RapidLevenshtein = None
+
+
+# Character after each backslash in a pattern, and the ones that start a
+# numeric or named escape
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+_NUMERIC_ESCAPES = frozenset('xu0123456789')
+
+
+def _compile_lowered(pattern: str) -> Optional[Pattern]:
+    """
+    Case-sensitive lowercase twin of an IGNORECASE pattern.
+
+    On lowercased ASCII text it matches exactly where the IGNORECASE
+    pattern matches the original, without sre folding every character.
+    None when lowering could change the pattern's meaning: non-ASCII, an
+    uppercase escape such as \\S or \\W, or a numeric or named escape
+    (\\x4F, \\u0041, \\N{...}, octal) that can spell an uppercase letter.
+    Backreferences are rejected too, since they share the digit syntax.
+    """
+    if not pattern.isascii():
+        return None
+    # Walk escapes pairwise so an escaped backslash (\\x) is not read as \x
+    if any(c.isupper() or c in _NUMERIC_ESCAPES for c in _ESCAPE_RE.findall(pattern)):
+        return None
+    try:
+        return re.compile(pattern.lower())
+    except re.error:
+        return None
+
+
+def _compile_both(patterns: Tuple[str, ...]) -> Tuple[List[Pattern], List[Pattern]]:
+    """IGNORECASE patterns for any text, plus lowercase twins for lowered ASCII text"""
+    return (
+        [re.compile(p, re.IGNORECASE) for p in patterns],
+        [_compile_lowered(p) for p in patterns],
+    )
+
 
 class ThreatLevel(Enum):
     CLEAN = 0
@@ -36,7 +111,26 @@ class ThreatLevel(Enum):
     ACTIVE_ATTACK = 4
 
 
-@dataclass
+# Verdicts of earlier CLI runs, keyed by a hash of (url, identity, html)
+CERATA_CACHE = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'cerata'
+VERDICT_CACHE_PATH = CERATA_CACHE / 'phishguard' / 'verdicts'
+VERDICT_CACHE_MAX_ENTRIES = 100000
+# Bump when detection logic changes, so stale verdicts miss
+_VERDICT_CACHE_PERSON = b'phishguard-v1'
+
+# CLI output is written in batches of this many reports, or this often
+REPORT_FLUSH_ITEMS = 100
+REPORT_FLUSH_SECONDS = 0.05
+
+# Items per task handed to a worker process by analyze_batch
+BATCH_CHUNK_SIZE = 32
+
+# Risk score at which each level above CLEAN begins
+_THREAT_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+_THREAT_LEVELS = tuple(ThreatLevel)
+
+
+@dataclass(slots=True)
 class IOCSignature:
     """Indicator of Compromise signature"""
     name: str
@@ -44,9 +138,29 @@ class IOCSignature:
     weight: float  # 0.0 to 1.0
     category: str
     description: str
+    # Lowercase literals, at least one of which every match must contain.
+    # Used to skip the regex when none occur; empty means always run it.
+    anchors: Tuple[str, ...] = ()
+    regex: Pattern = field(init=False, repr=False, compare=False)
+    lower_regex: Optional[Pattern] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.regex = re.compile(self.pattern, re.IGNORECASE)
+        self.lower_regex = _compile_lowered(self.pattern)
 
+    def search(self, text: str, text_lower: Optional[str] = None):
+        """
+        Search text for this signature.
 
-@dataclass
+        Pass text.lower() as text_lower for ASCII text to run the
+        case-sensitive lowercase twin instead of the IGNORECASE regex.
+        """
+        if text_lower is not None and self.lower_regex is not None:
+            return self.lower_regex.search(text_lower)
+        return self.regex.search(text)
+
+
+@dataclass(slots=True)
 class DetectionResult:
     """Result of phishing analysis"""
     url: str
@@ -70,6 +184,12 @@ class DetectionResult:
             'coherence': self.rose_glass_coherence
         }
 
+    def to_json_bytes(self) -> bytes:
+        """to_dict() as compact UTF-8 JSON, encoded by orjson when installed"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
 
 class SocialFishSignatures:
     """
@@ -154,6 +274,128 @@ class SocialFishSignatures:
         ],
     }
 
+    @staticmethod
+    def detect_platform(text: str) -> Optional[str]:
+        """First platform whose clone patterns occur in text, if any"""
+        for platform, regex in PLATFORM_CLONE_RES.items():
+            if regex.search(text):
+                return platform
+        return None
+
+
+def _alternation(patterns: List[str]) -> Pattern:
+    """Compile patterns into one case-insensitive alternation"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+
+
+# Kit fingerprints, each a single pass through the regex engine
+PLATFORM_CLONE_RES: Dict[str, Pattern] = {
+    platform: _alternation(patterns)
+    for platform, patterns in SocialFishSignatures.PLATFORM_CLONES.items()
+}
+DB_SCHEMA_RE = _alternation(SocialFishSignatures.DB_SCHEMA_PATTERNS)
+API_RE = _alternation(SocialFishSignatures.API_PATTERNS)
+
+# Top-level domains favoured by throwaway phishing hosts
+SUSPICIOUS_TLDS = frozenset({'xyz', 'tk', 'ml', 'ga', 'cf', 'gq', 'top', 'work', 'click'})
+# Impersonated brands paired with their official registrable domain
+_BRAND_DOMAINS = tuple(
+    (brand, f'{brand}.com')
+    for brand in ('facebook', 'google', 'linkedin', 'github', 'twitter', 'instagram', 'microsoft')
+)
+
+
+# Regexes used on every analysis, compiled once at import
+_IP_HOST_RE = re.compile(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}')
+# Digit homoglyphs mapped back to letters in one pass ('1' reads as 'l', not 'i')
+_HOMOGLYPH_TABLE = str.maketrans('0134598', 'oleasgb')
+_FORM_ACTION_RE = re.compile(r'<form[^>]*action=["\']([^"\']*)["\']')
+_PASSWORD_FIELD_RE = re.compile(r'<input[^>]*type=["\']password["\']')
+# Credential field stem in a name attribute (run on lowercased html)
+_CREDENTIAL_FIELD_RE = re.compile(
+    r'name=["\'][^"\']*('
+    + '|'.join(re.escape(f) for f in SocialFishSignatures.CREDENTIAL_FIELDS)
+    + r')[^"\']*["\']'
+)
+_HIDDEN_IFRAME_RE = re.compile(r'<iframe[^>]*(?:style=["\'][^"\']*display:\s*none|hidden)[^>]*>')
+_OBFUSCATION_RES, _OBFUSCATION_LOWER_RES = _compile_both((
+    r'eval\s*\([^)]*(?:unescape|decodeURIComponent|atob)',
+    r'document\.write\s*\([^)]*(?:unescape|decodeURIComponent)',
+    r'String\.fromCharCode\s*\([^)]*\)',
+    r'\\x[0-9a-f]{2}',
+))
+_EXFIL_RES, _EXFIL_LOWER_RES = _compile_both((
+    r'new\s+Image\(\)\.src\s*=',  # Pixel tracking for exfil
+    r'navigator\.sendBeacon',       # Beacon API
+    r'fetch\s*\([^)]*(?:password|credential|login)',
+    r'XMLHttpRequest[^;]*(?:password|credential)',
+))
+_URGENCY_RES, _URGENCY_LOWER_RES = _compile_both((
+    r'(?:account|password).*(?:expire|suspend|block|lock)',
+    r'(?:verify|confirm).*(?:immediately|now|urgent)',
+    r'(?:unusual|suspicious).*(?:activity|login)',
+    r'(?:security|safety).*(?:alert|warning|notice)',
+    r'(?:limited|expire).*(?:time|offer|access)',
+))
+_FAKE_TRUST_RES, _FAKE_TRUST_LOWER_RES = _compile_both((
+    r'(?:100%|completely)\s*(?:safe|secure)',
+    r'(?:bank|military)\s*(?:grade|level)\s*(?:security|encryption)',
+    r'(?:verified|certified)\s*(?:by|with)',
+    r'(?:trust|security)\s*(?:badge|seal|logo)',
+))
+_AMATEUR_RES, _AMATEUR_LOWER_RES = _compile_both((
+    r'(?:click\s*here|enter\s*details)',
+    r'(?:dear\s*user|dear\s*customer)',
+    r'(?:kindly|please\s*kindly)',
+))
+# Coherence dimensions scored by counting distinct matching patterns
+_COHERENCE_LOWER_RES = (_URGENCY_LOWER_RES, _FAKE_TRUST_LOWER_RES, _AMATEUR_LOWER_RES)
+_COHERENCE_RES = (_URGENCY_RES, _FAKE_TRUST_RES, _AMATEUR_RES)
+_hyperscan_local = threading.local()
+
+
+def _decode_page(content: Union[str, bytes]) -> str:
+    """Page text; raw bytes (e.g. straight off the network) are decoded once as UTF-8"""
+    if isinstance(content, str):
+        return content
+    return bytes(content).decode('utf-8', 'replace')
+
+
+def _count_matching(text: str, pattern_lists) -> List[int]:
+    """Per list, how many of its patterns occur in text"""
+    return [sum(1 for p in res if p.search(text)) for res in pattern_lists]
+
+
+@lru_cache(maxsize=None)
+def _coherence_database():
+    """Hyperscan database of the lowercase coherence patterns, and each one's list index"""
+    # Python's str \s also matches \x1c-\x1f; spell that out for PCRE semantics
+    whitespace = r'[\t\n\x0b\x0c\r \x1c-\x1f]'
+    patterns = [(bucket, p.pattern) for bucket, res in enumerate(_COHERENCE_LOWER_RES) for p in res]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[p.replace(r'\s', whitespace).encode('ascii') for _, p in patterns],
+        ids=list(range(len(patterns))),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+    )
+    return database, tuple(bucket for bucket, _ in patterns)
+
+
+def _count_matching_hyperscan(text_lower: str) -> List[int]:
+    """_count_matching over _COHERENCE_LOWER_RES in one Hyperscan pass (ASCII text only)"""
+    database, buckets = _coherence_database()
+    scratch = getattr(_hyperscan_local, 'scratch', None)
+    if scratch is None:
+        # Scratch space is per thread; the database is shared
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(database)
+    counts = [0] * len(_COHERENCE_LOWER_RES)
+
+    def on_match(pattern_id, start, end, flags, context):
+        counts[buckets[pattern_id]] += 1  # SINGLEMATCH: once per pattern
+
+    database.scan(text_lower.encode('ascii'), match_event_handler=on_match, scratch=scratch)
+    return counts
+
 
 class PhishGuard:
     """
@@ -167,9 +409,65 @@ class PhishGuard:
     5. Coherence Analysis - Rose Glass intent detection
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 0, cache_ttl: Optional[float] = None):
+        """
+        Args:
+            cache_size: Maximum number of recent verdicts kept for repeated
+                (url, html, identity) inputs (0, the default, disables the cache)
+            cache_ttl: Seconds a cached verdict stays valid (None = no expiry)
+        """
         self.signatures = self._load_signatures()
         self.known_legitimate_domains = self._load_legitimate_domains()
+        self._build_anchor_index()
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._result_cache: 'OrderedDict[Tuple, Tuple[Optional[float], DetectionResult]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_config = self._detection_config()
+
+    def _build_anchor_index(self):
+        """Map signature anchors to signature indices for the prefilter scan."""
+        self._anchor_sigs: Dict[str, set] = {}
+        self._unanchored = set()
+        for idx, sig in enumerate(self.signatures):
+            if not sig.anchors:
+                self._unanchored.add(idx)
+            for anchor in sig.anchors:
+                self._anchor_sigs.setdefault(anchor, set()).add(idx)
+        self._indexed_count = len(self.signatures)
+
+        self._anchor_automaton = None
+        if AHOCORASICK_AVAILABLE and self._anchor_sigs:
+            automaton = ahocorasick.Automaton()
+            for anchor in self._anchor_sigs:
+                automaton.add_word(anchor, anchor)
+            automaton.make_automaton()
+            self._anchor_automaton = automaton
+
+    def _candidate_signatures(self, html_content: str, html_lower: str) -> set:
+        """
+        Indices of signatures that can possibly match html_content.
+
+        All anchors are located in one pass (Aho-Corasick when available,
+        otherwise one substring search each), and only signatures with an
+        anchor present are handed to the regex engine. Non-ASCII pages skip
+        the prefilter: IGNORECASE folds some non-ASCII characters onto ASCII
+        letters (e.g. U+017F onto 's'), which str.lower() does not.
+        """
+        if not html_content.isascii():
+            return set(range(len(self.signatures)))
+
+        if self._anchor_automaton is not None:
+            present = {anchor for _, anchor in self._anchor_automaton.iter(html_lower)}
+        else:
+            present = {anchor for anchor in self._anchor_sigs if anchor in html_lower}
+
+        candidates = set(self._unanchored)
+        for anchor in present:
+            candidates |= self._anchor_sigs[anchor]
+        # Signatures appended after construction are not indexed; always run them
+        candidates.update(range(self._indexed_count, len(self.signatures)))
+        return candidates
 
     def _load_signatures(self) -> List[IOCSignature]:
         """Load all IOC signatures"""
@@ -181,7 +479,8 @@ class PhishGuard:
             pattern=r'/neptune',
             weight=0.95,
             category="admin_panel",
-            description="SocialFish admin panel path detected"
+            description="SocialFish admin panel path detected",
+            anchors=('/neptune',)
         ))
 
         signatures.append(IOCSignature(
@@ -189,7 +488,8 @@ class PhishGuard:
             pattern=r'SELECT.*FROM\s+creds',
             weight=0.90,
             category="database",
-            description="SocialFish credential database query pattern"
+            description="SocialFish credential database query pattern",
+            anchors=('creds',)
         ))
 
         # Generic phishing signatures
@@ -198,7 +498,8 @@ class PhishGuard:
             pattern=r'<form[^>]*action=["\'](?!https?://[^"\']*(?:facebook|google|linkedin|github|twitter|instagram|microsoft))',
             weight=0.70,
             category="form_hijack",
-            description="Form submits to non-legitimate domain"
+            description="Form submits to non-legitimate domain",
+            anchors=('<form',)
         ))
 
         signatures.append(IOCSignature(
@@ -206,7 +507,8 @@ class PhishGuard:
             pattern=r'<input[^>]*type=["\']hidden["\'][^>]*name=["\'](?:redirect|return|next|url)["\']',
             weight=0.60,
             category="redirect",
-            description="Hidden redirect field for post-harvest navigation"
+            description="Hidden redirect field for post-harvest navigation",
+            anchors=('<input',)
         ))
 
         signatures.append(IOCSignature(
@@ -214,7 +516,8 @@ class PhishGuard:
             pattern=r'<form[^>]*method=["\']post["\'][^>]*action=["\']https?://(?!(?:www\.)?(?:facebook|google|linkedin|github|twitter|instagram|microsoft)\.com)',
             weight=0.85,
             category="credential_exfil",
-            description="Form posts credentials to external server"
+            description="Form posts credentials to external server",
+            anchors=('<form',)
         ))
 
         signatures.append(IOCSignature(
@@ -222,7 +525,8 @@ class PhishGuard:
             pattern=r'(?:\/api\/|\/collect\/|\/harvest\/|\/grab\/|\/catch\/|\/log\/)',
             weight=0.75,
             category="exfiltration",
-            description="Common data exfiltration endpoint pattern"
+            description="Common data exfiltration endpoint pattern",
+            anchors=('/api/', '/collect/', '/harvest/', '/grab/', '/catch/', '/log/')
         ))
 
         signatures.append(IOCSignature(
@@ -230,7 +534,8 @@ class PhishGuard:
             pattern=r'(?:geoplugin|ipinfo|ipapi|freegeoip|ip-api)',
             weight=0.65,
             category="recon",
-            description="IP geolocation service for victim profiling"
+            description="IP geolocation service for victim profiling",
+            anchors=('geoplugin', 'ipinfo', 'ipapi', 'freegeoip', 'ip-api')
         ))
 
         signatures.append(IOCSignature(
@@ -238,7 +543,8 @@ class PhishGuard:
             pattern=r'(?:navigator\.(userAgent|platform|language)|screen\.(width|height)|canvas\.toDataURL)',
             weight=0.55,
             category="fingerprint",
-            description="Browser fingerprinting for victim identification"
+            description="Browser fingerprinting for victim identification",
+            anchors=('navigator.', 'screen.', 'canvas.todataurl')
         ))
 
         signatures.append(IOCSignature(
@@ -246,7 +552,8 @@ class PhishGuard:
             pattern=r'(?:ngrok\.io|ngrok\.app|tunnel\.)',
             weight=0.80,
             category="infrastructure",
-            description="Ngrok tunnel commonly used for phishing"
+            description="Ngrok tunnel commonly used for phishing",
+            anchors=('ngrok.io', 'ngrok.app', 'tunnel.')
         ))
 
         signatures.append(IOCSignature(
@@ -254,7 +561,8 @@ class PhishGuard:
             pattern=r'(?:faceb00k|g00gle|linkedln|instagran|micros0ft|tw1tter)',
             weight=0.90,
             category="domain",
-            description="Typosquatting domain detected"
+            description="Typosquatting domain detected",
+            anchors=('faceb00k', 'g00gle', 'linkedln', 'instagran', 'micros0ft', 'tw1tter')
         ))
 
         return signatures
@@ -274,15 +582,18 @@ class PhishGuard:
 
     def analyze_url(self, url: str) -> Dict:
         """Analyze URL for phishing indicators"""
+        return self._analyze_parsed_url(urlparse(url))
+
+    def _analyze_parsed_url(self, parsed: ParseResult) -> Dict:
+        """analyze_url() for a URL that has already been parsed"""
         anomalies = []
         risk_score = 0.0
 
-        parsed = urlparse(url)
         domain = parsed.netloc.lower()
         path = parsed.path.lower()
 
         # Check for IP address instead of domain
-        if re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', domain):
+        if _IP_HOST_RE.match(domain):
             anomalies.append("IP address used instead of domain name")
             risk_score += 0.6
 
@@ -294,17 +605,24 @@ class PhishGuard:
                 risk_score += 0.4
 
         # Check for typosquatting
+        suspect_base = domain.split('.')[0]
+        verdicts: Dict[str, bool] = {}
         for legit_domain in self.known_legitimate_domains:
-            if self._is_typosquat(domain, legit_domain):
+            legit_base = legit_domain.split('.')[0]
+            # Both tests need the labels within two characters of each other in length
+            if abs(len(suspect_base) - len(legit_base)) > 2:
+                continue
+            if legit_base not in verdicts:
+                verdicts[legit_base] = self._is_typosquat_base(suspect_base, legit_base)
+            if verdicts[legit_base]:
                 anomalies.append(f"Possible typosquat of {legit_domain}")
                 risk_score += 0.8
 
         # Check for suspicious TLDs
-        suspicious_tlds = ['.xyz', '.tk', '.ml', '.ga', '.cf', '.gq', '.top', '.work', '.click']
-        for tld in suspicious_tlds:
-            if domain.endswith(tld):
-                anomalies.append(f"Suspicious TLD: {tld}")
-                risk_score += 0.3
+        _, dot, tld = domain.rpartition('.')
+        if dot and tld in SUSPICIOUS_TLDS:
+            anomalies.append(f"Suspicious TLD: .{tld}")
+            risk_score += 0.3
 
         # Check for excessive subdomains (common in phishing)
         subdomain_count = domain.count('.')
@@ -313,8 +631,8 @@ class PhishGuard:
             risk_score += 0.4
 
         # Check for legitimate brand in subdomain (phishing pattern)
-        for brand in ['facebook', 'google', 'linkedin', 'github', 'twitter', 'instagram', 'microsoft']:
-            if brand in domain and not domain.endswith(f'{brand}.com'):
+        for brand, official in _BRAND_DOMAINS:
+            if brand in domain and not domain.endswith(official):
                 anomalies.append(f"Brand '{brand}' used in non-official domain")
                 risk_score += 0.7
 
@@ -336,20 +654,17 @@ class PhishGuard:
         # Remove TLD for comparison
         suspect_base = suspect.split('.')[0] if '.' in suspect else suspect
         legit_base = legitimate.split('.')[0] if '.' in legitimate else legitimate
+        return self._is_typosquat_base(suspect_base, legit_base)
 
+    def _is_typosquat_base(self, suspect_base: str, legit_base: str) -> bool:
+        """Check if a first domain label is a typosquat of a legitimate one"""
         # Check Levenshtein distance
         if self._levenshtein_distance(suspect_base, legit_base) <= 2:
             if suspect_base != legit_base:
                 return True
 
         # Check for common substitutions
-        substitutions = {
-            'o': '0', 'l': '1', 'i': '1', 'e': '3',
-            'a': '4', 's': '5', 'g': '9', 'b': '8'
-        }
-        normalized = suspect_base
-        for char, sub in substitutions.items():
-            normalized = normalized.replace(sub, char)
+        normalized = suspect_base.translate(_HOMOGLYPH_TABLE)
 
         if normalized == legit_base and suspect_base != legit_base:
             return True
@@ -357,96 +672,126 @@ class PhishGuard:
         return False
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
-        """Calculate Levenshtein edit distance"""
-        if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+        """
+        Calculate Levenshtein edit distance.
 
-        if len(s2) == 0:
-            return len(s1)
+        Uses rapidfuzz when installed; otherwise Myers' bit-parallel
+        algorithm (Hyyrö's formulation), which keeps a whole DP column in
+        the bits of two ints so each character of s1 costs a fixed handful
+        of integer operations instead of an inner loop over s2.
+        """
+        if RAPIDFUZZ_AVAILABLE:
+            return RapidLevenshtein.distance(s1, s2)
 
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
 
-        return previous_row[-1]
+        m = len(s2)
+        if m == 0:
+            return len(s1)
 
-    def analyze_html(self, html_content: str, source_url: str = "") -> Dict:
-        """Analyze HTML content for phishing indicators"""
+        # Bitmask of positions in s2 for each character
+        peq: Dict[str, int] = {}
+        for i, c in enumerate(s2):
+            peq[c] = peq.get(c, 0) | (1 << i)
+
+        full = (1 << m) - 1
+        last = 1 << (m - 1)
+        pv, mv, score = full, 0, m
+        for c in s1:
+            eq = peq.get(c, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            ph = ((ph << 1) | 1) & full
+            mh = (mh << 1) & full
+            pv = mh | (~(xv | ph) & full)
+            mv = ph & xv
+
+        return score
+
+    def analyze_html(self, html_content: Union[str, bytes], source_url: Union[str, ParseResult] = "") -> Dict:
+        """Analyze HTML content for phishing indicators (source_url may be pre-parsed)"""
         anomalies = []
         matched_sigs = []
         risk_score = 0.0
 
+        html_content = _decode_page(html_content)
+
         html_lower = html_content.lower()
+        # ASCII pages are scanned lowercased with case-sensitive patterns;
+        # others keep IGNORECASE, whose Unicode folding lower() can't mirror
+        folded = html_lower if html_content.isascii() else None
 
         # Check for form actions
-        form_pattern = r'<form[^>]*action=["\']([^"\']*)["\']'
-        forms = re.findall(form_pattern, html_lower)
+        forms = _FORM_ACTION_RE.findall(html_lower)
 
+        source_domain = None  # parsed on first use, once per page
+        posts_externally = False
         for form_action in forms:
             # Check if form posts to different domain
             if form_action.startswith('http'):
                 action_domain = urlparse(form_action).netloc
-                source_domain = urlparse(source_url).netloc if source_url else ""
+                if source_domain is None:
+                    if isinstance(source_url, ParseResult):
+                        source_domain = source_url.netloc
+                    else:
+                        source_domain = urlparse(source_url).netloc if source_url else ""
 
                 if action_domain and source_domain and action_domain != source_domain:
                     # Check if it's legitimate
                     if action_domain not in self.known_legitimate_domains:
                         anomalies.append(f"Form posts to external domain: {action_domain}")
                         risk_score += 0.7
+                        posts_externally = True
 
         # Check for password fields
-        password_fields = re.findall(r'<input[^>]*type=["\']password["\']', html_lower)
+        password_fields = _PASSWORD_FIELD_RE.findall(html_lower)
         if password_fields:
             anomalies.append(f"Contains {len(password_fields)} password field(s)")
             # Password field alone isn't suspicious, but combined with other factors
 
-        # Check for credential field names
-        for field_name in SocialFishSignatures.CREDENTIAL_FIELDS:
-            if re.search(rf'name=["\'][^"\']*{field_name}[^"\']*["\']', html_lower):
-                # Only flag if suspicious context
-                pass
-
-        # Check each signature
-        for sig in self.signatures:
-            if re.search(sig.pattern, html_content, re.IGNORECASE):
+        # Check for credential field names, flagged only in a suspicious
+        # context: when the page posts forms to an external domain
+        if posts_externally:
+            credential_fields = dict.fromkeys(_CREDENTIAL_FIELD_RE.findall(html_lower))
+            if credential_fields:
+                anomalies.append(f"Credential fields sent off-site: {', '.join(credential_fields)}")
+
+        # Check each signature whose anchors occur in the page
+        candidates = self._candidate_signatures(html_content, html_lower)
+        for idx, sig in enumerate(self.signatures):
+            if idx in candidates and sig.search(html_content, folded):
                 matched_sigs.append(sig)
                 risk_score += sig.weight * 0.5  # Weight contribution
                 anomalies.append(f"Matched signature: {sig.name}")
 
         # Check for hidden iframes
-        hidden_iframes = re.findall(r'<iframe[^>]*(?:style=["\'][^"\']*display:\s*none|hidden)[^>]*>', html_lower)
+        hidden_iframes = _HIDDEN_IFRAME_RE.findall(html_lower)
         if hidden_iframes:
             anomalies.append(f"Hidden iframes detected: {len(hidden_iframes)}")
             risk_score += 0.5
 
+        if folded is not None:
+            text, obfuscation_res, exfil_res = folded, _OBFUSCATION_LOWER_RES, _EXFIL_LOWER_RES
+        else:
+            text, obfuscation_res, exfil_res = html_content, _OBFUSCATION_RES, _EXFIL_RES
+
         # Check for obfuscated JavaScript
-        obfuscation_patterns = [
-            r'eval\s*\([^)]*(?:unescape|decodeURIComponent|atob)',
-            r'document\.write\s*\([^)]*(?:unescape|decodeURIComponent)',
-            r'String\.fromCharCode\s*\([^)]*\)',
-            r'\\x[0-9a-f]{2}',
-        ]
-        for pattern in obfuscation_patterns:
-            if re.search(pattern, html_content, re.IGNORECASE):
+        for pattern in obfuscation_res:
+            if pattern.search(text):
                 anomalies.append("Obfuscated JavaScript detected")
                 risk_score += 0.4
                 break
 
         # Check for data exfiltration patterns
-        exfil_patterns = [
-            r'new\s+Image\(\)\.src\s*=',  # Pixel tracking for exfil
-            r'navigator\.sendBeacon',       # Beacon API
-            r'fetch\s*\([^)]*(?:password|credential|login)',
-            r'XMLHttpRequest[^;]*(?:password|credential)',
-        ]
-        for pattern in exfil_patterns:
-            if re.search(pattern, html_content, re.IGNORECASE):
+        for pattern in exfil_res:
+            if pattern.search(text):
                 anomalies.append("Data exfiltration pattern detected")
                 risk_score += 0.6
                 break
@@ -459,7 +804,7 @@ class PhishGuard:
             'password_fields': len(password_fields)
         }
 
-    def analyze_coherence(self, page_content: str, claimed_identity: str = "") -> Dict:
+    def analyze_coherence(self, page_content: Union[str, bytes], claimed_identity: str = "") -> Dict:
         """
         Rose Glass coherence analysis.
 
@@ -481,20 +826,19 @@ class PhishGuard:
             'f': 1.0,    # Social trust signals
         }
         fractures = []
+        page_content = _decode_page(page_content)
+
+        # Lowercase ASCII pages once and match case-sensitively, all
+        # patterns in a single Hyperscan pass when it is installed
+        if not page_content.isascii():
+            counts = _count_matching(page_content, _COHERENCE_RES)
+        elif HYPERSCAN_AVAILABLE:
+            counts = _count_matching_hyperscan(page_content.lower())
+        else:
+            counts = _count_matching(page_content.lower(), _COHERENCE_LOWER_RES)
+        urgency_count, fake_trust_count, amateur_count = counts
 
         # Check for urgency manipulation (q-dimension attack)
-        urgency_patterns = [
-            r'(?:account|password).*(?:expire|suspend|block|lock)',
-            r'(?:verify|confirm).*(?:immediately|now|urgent)',
-            r'(?:unusual|suspicious).*(?:activity|login)',
-            r'(?:security|safety).*(?:alert|warning|notice)',
-            r'(?:limited|expire).*(?:time|offer|access)',
-        ]
-        urgency_count = 0
-        for pattern in urgency_patterns:
-            if re.search(pattern, page_content, re.IGNORECASE):
-                urgency_count += 1
-
         if urgency_count > 2:
             coherence['q'] = 0.9  # Artificially elevated
             fractures.append("Excessive urgency manipulation detected (q-dimension attack)")
@@ -508,24 +852,11 @@ class PhishGuard:
                 fractures.append(f"Claimed identity '{claimed_identity}' lacks consistent branding")
 
         # Check for trust signal coherence (f-dimension)
-        fake_trust_patterns = [
-            r'(?:100%|completely)\s*(?:safe|secure)',
-            r'(?:bank|military)\s*(?:grade|level)\s*(?:security|encryption)',
-            r'(?:verified|certified)\s*(?:by|with)',
-            r'(?:trust|security)\s*(?:badge|seal|logo)',
-        ]
-        fake_trust_count = sum(1 for p in fake_trust_patterns if re.search(p, page_content, re.IGNORECASE))
         if fake_trust_count > 1:
             coherence['f'] = 0.5
             fractures.append("Excessive trust signal injection (f-dimension manipulation)")
 
         # Check for professional implementation (ρ-dimension)
-        amateur_patterns = [
-            r'(?:click\s*here|enter\s*details)',
-            r'(?:dear\s*user|dear\s*customer)',
-            r'(?:kindly|please\s*kindly)',
-        ]
-        amateur_count = sum(1 for p in amateur_patterns if re.search(p, page_content, re.IGNORECASE))
         if amateur_count > 1:
             coherence['rho'] = 0.6
             fractures.append("Amateur implementation patterns detected")
@@ -549,24 +880,90 @@ class PhishGuard:
             'is_authentic': overall > 0.75 and len(fractures) == 0
         }
 
-    def analyze(self, url: str, html_content: str = "", claimed_identity: str = "") -> DetectionResult:
+    def _cache_key(self, url: str, html_content: Union[str, bytes], claimed_identity: str) -> Tuple:
+        """Cache key; the page is reduced to a 128-bit blake2b fingerprint."""
+        is_text = isinstance(html_content, str)
+        # Raw bytes are hashed as-is, without a decode/encode round trip
+        data = html_content.encode('utf-8', 'surrogatepass') if is_text else html_content
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        return (url, digest, is_text, claimed_identity)
+
+    def _detection_config(self) -> Tuple:
+        """Cheap fingerprint of the signature and legitimate-domain setup."""
+        return (id(self.signatures), len(self.signatures),
+                id(self.known_legitimate_domains), len(self.known_legitimate_domains))
+
+    def _cached_result(self, key: Tuple) -> Optional[DetectionResult]:
+        """Fresh cached verdict for key, if any (refreshes its LRU position)."""
+        config = self._detection_config()
+        with self._cache_lock:
+            if config != self._cache_config:
+                # Signatures or domains were added, removed or replaced
+                self._result_cache.clear()
+                self._cache_config = config
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            expiry, result = entry
+            if expiry is not None and expiry <= time.monotonic():
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+            return result
+
+    def _store_result(self, key: Tuple, result: DetectionResult):
+        """Insert a verdict, evicting the least recently used beyond cache_size."""
+        expiry = time.monotonic() + self.cache_ttl if self.cache_ttl is not None else None
+        with self._cache_lock:
+            self._result_cache[key] = (expiry, result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Forget all cached verdicts."""
+        with self._cache_lock:
+            self._result_cache.clear()
+
+    def analyze(self, url: str, html_content: Union[str, bytes] = "", claimed_identity: str = "") -> DetectionResult:
         """
         Full phishing analysis pipeline.
 
+        html_content may be a str or the raw UTF-8 bytes of the page.
+
         Returns comprehensive detection result with threat level,
-        confidence, and recommendations.
+        confidence, and recommendations. With cache_size > 0, repeated
+        inputs are answered from a bounded LRU cache of recent verdicts;
+        cached results are shared objects and carry the timestamp of the
+        original analysis. The cache is dropped when signatures or
+        known_legitimate_domains grow, shrink or are reassigned; call
+        clear_cache() after editing an entry in place.
         """
+        if self.cache_size <= 0:
+            return self._analyze_uncached(url, html_content, claimed_identity)
+
+        key = self._cache_key(url, html_content, claimed_identity)
+        result = self._cached_result(key)
+        if result is None:
+            result = self._analyze_uncached(url, html_content, claimed_identity)
+            self._store_result(key, result)
+        return result
+
+    def _analyze_uncached(self, url: str, html_content: Union[str, bytes], claimed_identity: str) -> DetectionResult:
+        """Run every analysis layer and build the detection result."""
+        html_content = _decode_page(html_content)
         all_anomalies = []
         all_signatures = []
 
-        # URL Analysis
-        url_analysis = self.analyze_url(url)
+        # URL Analysis (parsed once, shared with the HTML layer)
+        parsed_url = urlparse(url)
+        url_analysis = self._analyze_parsed_url(parsed_url)
         all_anomalies.extend(url_analysis['anomalies'])
 
         # HTML Analysis (if provided)
         html_analysis = {'risk_score': 0, 'anomalies': [], 'matched_signatures': []}
         if html_content:
-            html_analysis = self.analyze_html(html_content, url)
+            html_analysis = self.analyze_html(html_content, parsed_url)
             all_anomalies.extend(html_analysis['anomalies'])
             all_signatures.extend(html_analysis['matched_signatures'])
 
@@ -583,17 +980,8 @@ class PhishGuard:
             (1 - coherence_analysis['overall_coherence'] if coherence_analysis else 0) * 0.2
         )
 
-        # Determine threat level
-        if risk_score < 0.2:
-            threat_level = ThreatLevel.CLEAN
-        elif risk_score < 0.4:
-            threat_level = ThreatLevel.SUSPICIOUS
-        elif risk_score < 0.6:
-            threat_level = ThreatLevel.LIKELY_PHISH
-        elif risk_score < 0.8:
-            threat_level = ThreatLevel.CONFIRMED_PHISH
-        else:
-            threat_level = ThreatLevel.ACTIVE_ATTACK
+        # Determine threat level (a score on a threshold takes the higher level)
+        threat_level = _THREAT_LEVELS[bisect.bisect_right(_THREAT_THRESHOLDS, risk_score)]
 
         # Generate recommendations
         recommendations = self._generate_recommendations(
@@ -610,6 +998,50 @@ class PhishGuard:
             rose_glass_coherence=coherence_analysis
         )
 
+    def analyze_batch(self, items: Iterable[Tuple[str, ...]], workers: int = 1) -> Iterator[DetectionResult]:
+        """
+        Analyze a feed of (url, html_content, claimed_identity) items.
+
+        Trailing fields may be omitted, as with analyze(). Results are
+        yielded lazily in input order, so arbitrarily large feeds can be
+        streamed; compiled patterns and indexes are shared by every item.
+
+        Args:
+            items: Iterable of analyze() argument tuples
+            workers: Worker processes to spread items over (0 = one per
+                CPU). The regex engine holds the GIL, so processes rather
+                than threads; only a few chunks per worker are in flight.
+        """
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        if workers < 2:
+            analyze = self.analyze
+            for item in items:
+                yield analyze(*item)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        initargs = (self.signatures, self.known_legitimate_domains, self.cache_size, self.cache_ttl)
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=initargs) as executor:
+            try:
+                item_iter = iter(items)
+                while True:
+                    chunk = [tuple(item) for item in islice(item_iter, BATCH_CHUNK_SIZE)]
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(_analyze_batch_chunk, chunk))
+                    if len(pending) > 2 * workers:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                # Consumer stopped early: drop work that has not started
+                for future in pending:
+                    future.cancel()
+
     def _generate_recommendations(
         self,
         threat_level: ThreatLevel,
@@ -647,6 +1079,24 @@ class PhishGuard:
         return recommendations
 
 
+_batch_guard: Optional[PhishGuard] = None
+
+
+def _init_batch_worker(signatures: List[IOCSignature], legitimate_domains: set,
+                       cache_size: int, cache_ttl: Optional[float]):
+    """Build this worker process's PhishGuard with the parent's configuration"""
+    global _batch_guard
+    _batch_guard = PhishGuard(cache_size=cache_size, cache_ttl=cache_ttl)
+    _batch_guard.signatures = signatures
+    _batch_guard.known_legitimate_domains = legitimate_domains
+    _batch_guard._build_anchor_index()
+
+
+def _analyze_batch_chunk(chunk: List[Tuple[str, ...]]) -> List[DetectionResult]:
+    """Analyze one chunk of batch items in a worker process"""
+    return [_batch_guard.analyze(*item) for item in chunk]
+
+
 class NetworkAnalyzer:
     """
     Network-level phishing detection.
@@ -735,10 +1185,7 @@ class NetworkAnalyzer:
         }
 
 
-def main():
-    """Demo the PhishGuard detector"""
-
-    print("""
+_BANNER = """
     ╔═══════════════════════════════════════════════════════════════╗
     ║                      🛡️  PhishGuard  🛡️                       ║
     ║        SocialFish Detection & Phishing Kit Analyzer          ║
@@ -746,7 +1193,200 @@ def main():
     ║  Reverse-engineered from SocialFish to detect its patterns   ║
     ║  Rose Glass coherence analysis for intent detection          ║
     ╚═══════════════════════════════════════════════════════════════╝
-    """)
+    """
+# ASCII banner for piped output, matching _PLAIN_GLYPHS
+_PLAIN_BANNER = """
+    PhishGuard - SocialFish Detection & Phishing Kit Analyzer
+    Reverse-engineered from SocialFish to detect its patterns
+    Rose Glass coherence analysis for intent detection
+    """
+
+# Rose Glass dimensions block of the demo report, one format call per result
+_COHERENCE_TEMPLATE = (
+    "   Ψ (Consistency): {psi:.2f}\n"
+    "   ρ (Professionalism): {rho:.2f}\n"
+    "   q (Activation): {q:.2f}\n"
+    "   f (Trust Signals): {f:.2f}\n"
+    "   Overall: {overall:.2f}"
+)
+
+
+# Report decorations: emoji for terminals, plain ASCII when piped to logs
+_TTY_GLYPHS = {
+    'threat': '🎯 ', 'confidence': '📊 ', 'anomalies': '⚠️  ', 'signatures': '🔍 ',
+    'coherence': '🌹 ', 'fractures': '⚡ ', 'recommendations': '📋 ',
+    'bullet': '   • ', 'sub_bullet': '      • ', 'arrow': '   → ',
+}
+_PLAIN_GLYPHS = {
+    'threat': '', 'confidence': '', 'anomalies': '! ', 'signatures': '',
+    'coherence': '', 'fractures': '! ', 'recommendations': '',
+    'bullet': '   * ', 'sub_bullet': '      * ', 'arrow': '   -> ',
+}
+
+
+def _write_stdout(data: bytes):
+    """Write pre-encoded output straight to stdout's file descriptor, bypassing TextIOWrapper."""
+    stream = sys.stdout
+    stream.flush()
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        # stdout replaced by an in-memory stream (e.g. captured output)
+        stream.write(data.decode(stream.encoding or 'utf-8'))
+        return
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _stdout_writer(chunks: 'queue.Queue[Optional[bytes]]', errors: List[BaseException]):
+    """
+    Drain rendered output from chunks until a None sentinel arrives.
+
+    Chunks are joined and written once REPORT_FLUSH_ITEMS have gathered or
+    REPORT_FLUSH_SECONDS after the first of a batch, so the analysis thread
+    never waits on a slow stdout. A failed write (e.g. a closed pipe) is
+    recorded in errors and later chunks are discarded.
+    """
+    batch = []
+    deadline = 0.0
+    while True:
+        timeout = max(0.0, deadline - time.monotonic()) if batch else None
+        try:
+            chunk = chunks.get(timeout=timeout)
+        except queue.Empty:
+            chunk = b''  # batch is due
+        if chunk:
+            if not batch:
+                deadline = time.monotonic() + REPORT_FLUSH_SECONDS
+            batch.append(chunk)
+            if len(batch) < REPORT_FLUSH_ITEMS:
+                continue
+        if batch and not errors:
+            try:
+                _write_stdout(b"".join(batch))
+            except OSError as exc:
+                errors.append(exc)
+        batch = []
+        if chunk is None:
+            return
+
+
+def _read_feed(path: str) -> Iterator[Dict]:
+    """Stream a JSON-lines feed of {"url", "html", "identity"} objects ('-' = stdin)"""
+    stream = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    try:
+        for line in stream:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            yield {
+                'name': item.get('name', item['url']),
+                'url': item['url'],
+                'html': item.get('html', ''),
+                'identity': item.get('identity', ''),
+            }
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _verdict_key(url: str, html_content: str, claimed_identity: str) -> str:
+    """Persistent cache key for one analysis input."""
+    digest = hashlib.blake2b(digest_size=16, person=_VERDICT_CACHE_PERSON)
+    for part in (url, claimed_identity, html_content):
+        data = part.encode('utf-8', 'surrogatepass')
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _open_verdict_cache() -> Optional[shelve.Shelf]:
+    """Open the on-disk verdict cache, or None when it is unavailable."""
+    try:
+        VERDICT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        return shelve.open(str(VERDICT_CACHE_PATH))
+    except Exception:
+        # Caching is best effort (read-only home, locked or corrupt db)
+        return None
+
+
+def _close_verdict_cache(cache: shelve.Shelf):
+    """Evict the oldest verdicts past VERDICT_CACHE_MAX_ENTRIES and close."""
+    try:
+        excess = len(cache) - VERDICT_CACHE_MAX_ENTRIES
+        if excess > 0:
+            # Trim to 90% so the full sort is paid once per many runs
+            excess += VERDICT_CACHE_MAX_ENTRIES // 10
+            stored_at = {key: cache[key][0] for key in cache.keys()}
+            for key in sorted(stored_at, key=stored_at.get)[:excess]:
+                del cache[key]
+    except Exception:
+        pass
+    finally:
+        cache.close()
+
+
+def _analyze_cached(guard: PhishGuard, cache: Optional[shelve.Shelf],
+                    url: str, html_content: str, claimed_identity: str) -> DetectionResult:
+    """guard.analyze(), answered from the on-disk verdict cache when possible."""
+    if cache is None:
+        return guard.analyze(url, html_content, claimed_identity)
+
+    key = _verdict_key(url, html_content, claimed_identity)
+    try:
+        # Stored as to_dict() JSON, so entries don't depend on how the
+        # module was imported (pickled classes would bind to __main__)
+        data = json.loads(cache[key][1])
+        by_name = {sig.name: sig for sig in guard.signatures}
+        return DetectionResult(
+            url=data['url'],
+            threat_level=ThreatLevel[data['threat_level']],
+            confidence=data['confidence'],
+            matched_signatures=[by_name[name] for name in data['matched_signatures']],
+            anomalies=data['anomalies'],
+            recommendations=data['recommendations'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            rose_glass_coherence=data['coherence']
+        )
+    except Exception:
+        # Missing, unreadable, or naming a signature this guard lacks
+        pass
+
+    result = guard.analyze(url, html_content, claimed_identity)
+    try:
+        cache[key] = (time.time(), result.to_json_bytes())
+    except Exception:
+        pass
+    return result
+
+
+def _signature_timings(signatures: List[IOCSignature], html_content: Union[str, bytes]) -> Dict[str, float]:
+    """Milliseconds each signature's search takes on the page, run as analyze_html runs it."""
+    html_content = _decode_page(html_content)
+    folded = html_content.lower() if html_content.isascii() else None
+    timings = {}
+    for sig in signatures:
+        start = time.perf_counter_ns()
+        sig.search(html_content, folded)
+        timings[sig.name] = (time.perf_counter_ns() - start) / 1e6
+    return timings
+
+
+def main():
+    """
+    Demo the PhishGuard detector, or scan a feed.
+
+    Usage: python phishguard.py [feed.jsonl | -] [--json] [--no-cache] [--profile]
+    --json skips the human-readable report and emits one JSON verdict per line.
+    Verdicts are remembered across runs unless --no-cache is given.
+    --profile shows how long each matched signature's regex takes on the page.
+    """
+    feeds = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    as_json = '--json' in sys.argv
+
+    if not as_json:
+        print(_BANNER if sys.stdout.isatty() else _PLAIN_BANNER)
 
     guard = PhishGuard()
 
@@ -786,49 +1426,95 @@ def main():
             'identity': 'bank'
         },
     ]
+    if feeds:
+        test_cases = _read_feed(feeds[0])
+
+    cache = _open_verdict_cache() if '--no-cache' not in sys.argv else None
+    try:
+        _report(guard, cache, test_cases, as_json, '--profile' in sys.argv)
+    finally:
+        if cache is not None:
+            _close_verdict_cache(cache)
+
+
+def _render_report(test: Dict, result: DetectionResult, g: Dict[str, str], profile: bool = False) -> str:
+    """Human-readable report for one analyzed test case, newline-terminated."""
+    bullet = g['bullet']
+    out = [
+        f"\n{'='*60}",
+        f"Testing: {test['name']}",
+        f"URL: {test['url']}",
+        f"{'='*60}",
+        f"\n{g['threat']}Threat Level: {result.threat_level.name}",
+        f"{g['confidence']}Confidence: {result.confidence:.1%}",
+    ]
 
-    for test in test_cases:
-        print(f"\n{'='*60}")
-        print(f"Testing: {test['name']}")
-        print(f"URL: {test['url']}")
-        print(f"{'='*60}")
+    if result.anomalies:
+        out.append(f"\n{g['anomalies']}Anomalies Detected:")
+        out.extend(bullet + anomaly for anomaly in result.anomalies)
+
+    if result.matched_signatures:
+        out.append(f"\n{g['signatures']}Matched Signatures:")
+        if profile:
+            timings = _signature_timings(result.matched_signatures, test['html'])
+            out.extend(
+                f"{bullet}{sig.name} [{timings[sig.name]:.2f}ms]: {sig.description}"
+                for sig in result.matched_signatures
+            )
+        else:
+            out.extend(bullet + sig.name + ": " + sig.description for sig in result.matched_signatures)
 
-        result = guard.analyze(
-            url=test['url'],
-            html_content=test['html'],
-            claimed_identity=test['identity']
-        )
+    coherence = result.rose_glass_coherence
+    if coherence:
+        out.append(f"\n{g['coherence']}Rose Glass Coherence Analysis:")
+        out.append(_COHERENCE_TEMPLATE.format(
+            overall=coherence['overall_coherence'], **coherence['dimensions']
+        ))
+
+        fractures = coherence['fractures']
+        if fractures:
+            out.append(f"\n   {g['fractures']}Dimensional Fractures:")
+            out.extend(g['sub_bullet'] + fracture for fracture in fractures)
+
+    out.append(f"\n{g['recommendations']}Recommendations:")
+    if result.recommendations:
+        arrow = g['arrow']
+        out.append(arrow + ("\n" + arrow).join(result.recommendations))
+
+    out.append("")
+    return "\n".join(out)
 
-        print(f"\n🎯 Threat Level: {result.threat_level.name}")
-        print(f"📊 Confidence: {result.confidence:.1%}")
-
-        if result.anomalies:
-            print("\n⚠️  Anomalies Detected:")
-            for anomaly in result.anomalies:
-                print(f"   • {anomaly}")
-
-        if result.matched_signatures:
-            print("\n🔍 Matched Signatures:")
-            for sig in result.matched_signatures:
-                print(f"   • {sig.name}: {sig.description}")
-
-        if result.rose_glass_coherence:
-            print("\n🌹 Rose Glass Coherence Analysis:")
-            dims = result.rose_glass_coherence['dimensions']
-            print(f"   Ψ (Consistency): {dims['psi']:.2f}")
-            print(f"   ρ (Professionalism): {dims['rho']:.2f}")
-            print(f"   q (Activation): {dims['q']:.2f}")
-            print(f"   f (Trust Signals): {dims['f']:.2f}")
-            print(f"   Overall: {result.rose_glass_coherence['overall_coherence']:.2f}")
-
-            if result.rose_glass_coherence['fractures']:
-                print("\n   ⚡ Dimensional Fractures:")
-                for fracture in result.rose_glass_coherence['fractures']:
-                    print(f"      • {fracture}")
-
-        print("\n📋 Recommendations:")
-        for rec in result.recommendations:
-            print(f"   → {rec}")
+
+def _report(guard: PhishGuard, cache: Optional[shelve.Shelf], test_cases: Iterable[Dict],
+            as_json: bool, profile: bool = False):
+    """
+    Analyze the test cases and stream the report (or JSON verdicts) to stdout.
+
+    Analysis and rendering stay on this thread; a writer thread batches
+    the encoded output, so stdout backpressure overlaps with analysis.
+    """
+    g = _TTY_GLYPHS if sys.stdout.isatty() else _PLAIN_GLYPHS
+    encoding, errors = sys.stdout.encoding or 'utf-8', sys.stdout.errors or 'strict'
+
+    chunks: 'queue.Queue[Optional[bytes]]' = queue.Queue(maxsize=4 * REPORT_FLUSH_ITEMS)
+    write_errors: List[BaseException] = []
+    writer = threading.Thread(target=_stdout_writer, args=(chunks, write_errors), daemon=True)
+    writer.start()
+    try:
+        for test in test_cases:
+            result = _analyze_cached(guard, cache, test['url'], test['html'], test['identity'])
+            if as_json:
+                # Pipeline mode: verdicts only, no report formatting
+                chunks.put(result.to_json_bytes() + b"\n")
+            else:
+                chunks.put(_render_report(test, result, g, profile).encode(encoding, errors))
+            if write_errors:
+                break
+    finally:
+        chunks.put(None)
+        writer.join()
+    if write_errors:
+        raise write_errors[0]
 
 
 if __name__ == "__main__":